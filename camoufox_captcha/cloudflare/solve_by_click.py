@@ -1,6 +1,7 @@
 import asyncio
 import logging
-from typing import Optional, Union, Literal
+import time
+from typing import Optional, Tuple, Union, Literal
 
 from playwright.async_api import (
     Page,
@@ -11,18 +12,67 @@ from playwright.async_api import (
 )
 from playwright._impl._errors import TargetClosedError, Error as CrashedError
 
-from utils.logger import Logger
-
-logger = Logger().get_logger()
+# shared with the scraper, configured by utils.logger.Logger
+logger = logging.getLogger('Upwork')
 
 from camoufox_captcha.cloudflare.utils.detection import detect_cloudflare_challenge
 from camoufox_captcha.cloudflare.utils.dom_helpers import get_ready_checkbox
 from camoufox_captcha.common.detection import detect_expected_content
 from camoufox_captcha.common.shadow_root import (
+    clear_shadow_root_cache,
     search_shadow_root_iframes,
     search_shadow_root_elements,
+    wait_for_shadow_root_element,
+)
+
+CF_CHALLENGE_IFRAME_SRC = (
+    'https://challenges.cloudflare.com/cdn-cgi/challenge-platform/'
 )
 
+# body text logged for debugging, clipped in the browser so only the logged part is transferred
+BODY_SNAPSHOT_JS = "() => document.body ? document.body.innerText.slice(0, 300) : ''"
+
+
+async def _debug_body_snapshot(queryable: Union[Page, Frame, ElementHandle]) -> str:
+    """
+    Get the beginning of the page body text for debugging
+
+    :param queryable: Page, Frame, ElementHandle
+    :return: First 300 characters of the body text
+    """
+
+    return await queryable.evaluate(BODY_SNAPSHOT_JS)
+
+
+async def _safe_debug_body(
+    queryable: Union[Page, Frame, ElementHandle], browser_context: BrowserContext
+) -> Tuple[Union[Page, Frame, ElementHandle], Optional[str]]:
+    """
+    Log the beginning of the page body text when debugging, creating a new page if the current one crashed
+
+    :param queryable: Page, Frame, ElementHandle
+    :param browser_context: BrowserContext used to create a new page after a crash
+    :return: Queryable to continue with (a new page if the old one crashed) and the body text, if it was fetched
+    """
+
+    if not logger.isEnabledFor(logging.DEBUG):
+        return queryable, None
+
+    try:
+        body_text = await _debug_body_snapshot(queryable)
+    except TargetClosedError:
+        logger.warning('Page or browser crashed. Creating new page...')
+        try:
+            return await browser_context.new_page(), None
+        except Exception as create_exc:
+            logger.exception(
+                'Failed to create new page after crash. - the browser likely crashed'
+            )
+            raise create_exc
+
+    logger.debug(f'Current page body: {body_text}')
+    return queryable, body_text
+
 
 async def solve_cloudflare_by_click(
     queryable: Union[Page, Frame, ElementHandle],
@@ -35,6 +85,7 @@ async def solve_cloudflare_by_click(
     wait_checkbox_delay: int = 6,
     checkbox_click_attempts: int = 3,
     attempt_delay: int = 5,
+    load_state_timeout: int = 2500,
 ) -> bool:
     """
     Solve Cloudflare challenge by searching for & clicking the checkbox input
@@ -48,64 +99,66 @@ async def solve_cloudflare_by_click(
     :param wait_checkbox_delay: Delay between wait_checkbox_attempts in seconds to find the checkbox and wait for it to be ready
     :param checkbox_click_attempts: Maximum number of attempts to click the checkbox
     :param attempt_delay: Delay between solve attempts in seconds
+    :param load_state_timeout: Maximum time in milliseconds to wait for 'domcontentloaded' on each attempt, raise for slow networks
     :return: True if solved, False otherwise
     """
 
     logger.debug(f'Starting Cloudflare {challenge_type} challenge solving by click...')
 
+    retry_immediately = False
     for attempt in range(solve_attempts):
         if attempt > 0:
-            await asyncio.sleep(attempt_delay)
+            if not retry_immediately:
+                await asyncio.sleep(attempt_delay)
+            retry_immediately = False
 
             logger.debug(f'Retrying to solve ({attempt + 1}/{solve_attempts})...')
 
-        # attempt to get the body text and print for debugging
-        if logger.isEnabledFor(logging.DEBUG):
-            try:
-                body_text = await queryable.locator('body').inner_text()
-                logger.debug(f'Current page body: {body_text[:300]}')
-            except TargetClosedError:
-                logger.warning('Page or browser crashed. Creating new page...')
-                try:
-                    queryable = await browser_context.new_page()
-                except Exception as create_exc:
-                    logger.exception(
-                        'Failed to create new page after crash. - the browser likely crashed'
-                    )
-                    raise create_exc
+        # the DOM may have changed since the previous attempt
+        clear_shadow_root_cache()
 
-        # 1. check if Cloudflare challenge is present
-        cloudflare_detected = await detect_cloudflare_challenge(
-            queryable, challenge_type
-        )
-        expected_content_detected = await detect_expected_content(
+        # expected content means the challenge is already solved, no need to probe for Cloudflare
+        if expected_content_selector and await detect_expected_content(
             queryable, expected_content_selector
+        ):
+            logger.debug('Expected content detected')
+            return True
+
+        # 1. check if Cloudflare challenge is present
+        # (the body text is fetched concurrently for debugging, once per attempt)
+        cloudflare_detected, debug_body = await asyncio.gather(
+            detect_cloudflare_challenge(queryable, challenge_type),
+            _safe_debug_body(queryable, browser_context),
+            return_exceptions=True,
         )
-        if not cloudflare_detected or expected_content_detected:
+        if isinstance(debug_body, BaseException):
+            raise debug_body
+        new_queryable, _ = debug_body
+        if new_queryable is not queryable:
+            # detection ran against the crashed page, repeat it on the new one
+            queryable = new_queryable
+            cloudflare_detected = await detect_cloudflare_challenge(
+                queryable, challenge_type
+            )
+        if isinstance(cloudflare_detected, BaseException):
+            raise cloudflare_detected
+        if not cloudflare_detected:
             logger.debug('No Cloudflare challenge detected')
-
-            # attempt to get the body text and print for debugging
-            if logger.isEnabledFor(logging.DEBUG):
-                try:
-                    body_text = await queryable.locator('body').inner_text()
-                    logger.debug(f'Current page body: {body_text[:300]}')
-                except TargetClosedError:
-                    logger.warning('Page or browser crashed. Creating new page...')
-                    try:
-                        queryable = await browser_context.new_page()
-                    except Exception as create_exc:
-                        logger.exception(
-                            'Failed to create new page after crash. - the browser likely crashed'
-                        )
-                        raise create_exc
-
             return True
 
         # wait for page to load
+        load_state_start = time.monotonic()
         try:
-            await queryable.wait_for_load_state('domcontentloaded', timeout=10000)
+            await queryable.wait_for_load_state(
+                'domcontentloaded', timeout=load_state_timeout
+            )
+            logger.debug(
+                f"Page reached 'domcontentloaded' in {time.monotonic() - load_state_start:.2f}s"
+            )
         except PlaywrightTimeoutError:
-            logger.debug(f"Page did not reach 'domcontentloaded'.")
+            logger.debug(
+                f"Page did not reach 'domcontentloaded' within {load_state_timeout}ms."
+            )
         except CrashedError:
             logger.debug('Caught CrashedError – page was already closed')
             logger.debug(f'page: {queryable}')
@@ -113,8 +166,23 @@ async def solve_cloudflare_by_click(
 
         # 2. find Cloudflare iframes
         cf_iframes = await search_shadow_root_iframes(
-            queryable, 'https://challenges.cloudflare.com/cdn-cgi/challenge-platform/'
+            queryable, CF_CHALLENGE_IFRAME_SRC
         )
+        if not cf_iframes and attempt == 0 and not isinstance(queryable, ElementHandle):
+            # the challenge script may not have injected its iframe yet,
+            # wait briefly for it instead of spending a whole attempt_delay
+            logger.debug('Cloudflare iframes not found yet, waiting for them...')
+            try:
+                await wait_for_shadow_root_element(
+                    queryable, f'iframe[src*="{CF_CHALLENGE_IFRAME_SRC}"]', timeout=2000
+                )
+                clear_shadow_root_cache()
+                cf_iframes = await search_shadow_root_iframes(
+                    queryable, CF_CHALLENGE_IFRAME_SRC
+                )
+            except Exception as e:
+                logger.debug(f'Cloudflare iframes did not appear: {e}')
+                retry_immediately = True
         if not cf_iframes:
             logger.debug(f'Cloudflare iframes not found')
             continue
@@ -144,61 +212,24 @@ async def solve_cloudflare_by_click(
             logger.debug(f'Failed to click checkbox after maximum attempts')
             continue
 
-        # attempt to get the body text and print for debugging
-        if logger.isEnabledFor(logging.DEBUG):
-            try:
-                body_text = await queryable.locator('body').inner_text()
-                logger.debug(f'Current page body: {body_text[:300]}')
-            except TargetClosedError:
-                logger.warning('Page or browser crashed. Creating new page...')
-                try:
-                    queryable = await browser_context.new_page()
-                except Exception as create_exc:
-                    logger.exception(
-                        'Failed to create new page after crash. - the browser likely crashed'
-                    )
-                    raise create_exc
-
         # 5. verify success
-        if challenge_type == 'turnstile':
-            logger.debug('verifying turnstile')
-            # for turnstile, check for success element in the cf's iframe or expected content is present
-            cloudflare_detected = await detect_cloudflare_challenge(
-                queryable, challenge_type
-            )
-            challenge_solved = not cloudflare_detected
-            # success_elements = await search_shadow_root_elements(iframe, 'div[id="success"]')
-            # challenge_solved = bool(success_elements)
-        else:
-            logger.debug('verifying interstitial')
-            # for interstitial, check if challenge is gone or expected content is present
-            cloudflare_detected = await detect_cloudflare_challenge(
-                queryable, challenge_type
-            )
-            challenge_solved = not cloudflare_detected
-
-        expected_content_detected = await detect_expected_content(
-            queryable, expected_content_selector
+        # for turnstile, check for success element in the cf's iframe or expected content is present
+        # for interstitial, check if challenge is gone or expected content is present
+        logger.debug(f'verifying {challenge_type}')
+        cloudflare_detected, expected_content_detected = await asyncio.gather(
+            detect_cloudflare_challenge(queryable, challenge_type),
+            detect_expected_content(queryable, expected_content_selector),
         )
+        challenge_solved = not cloudflare_detected
+        # success_elements = await search_shadow_root_elements(iframe, 'div[id="success"]')
+        # challenge_solved = bool(success_elements)
         if challenge_solved or expected_content_detected:
             logger.debug('Solved successfully')
             logger.debug(f'challenge_solved: {challenge_solved}')
             logger.debug(f'expected_content_detected: {expected_content_detected}')
 
-            # attempt to get the body text and print for debugging
-            if logger.isEnabledFor(logging.DEBUG):
-                try:
-                    body_text = await queryable.locator('body').inner_text()
-                    logger.debug(f'Current page body: {body_text[:300]}')
-                except TargetClosedError:
-                    logger.warning('Page or browser crashed. Creating new page...')
-                    try:
-                        queryable = await browser_context.new_page()
-                    except Exception as create_exc:
-                        logger.exception(
-                            'Failed to create new page after crash. - the browser likely crashed'
-                        )
-                        raise create_exc
+            # attempt to get the body text after the click and print for debugging
+            await _safe_debug_body(queryable, browser_context)
 
             return True
 
@@ -1,21 +1,20 @@
-from typing import Literal, Union
+from typing import Dict, List, Literal, Union
 import asyncio
+import logging
 
 from playwright.async_api import ElementHandle, Frame, Page
 
-from utils.logger import Logger
-
-logger = Logger().get_logger()
+# shared with the scraper, configured by utils.logger.Logger
+logger = logging.getLogger('Upwork')
 
 
 from playwright._impl._errors import Error as PlaywrightError
 
 
-async def safe_query(page, selector, retries=3, delay=2):
+async def safe_evaluate(queryable, expression, arg=None, retries=3, delay=2):
     for attempt in range(retries):
         try:
-            await page.wait_for_load_state('domcontentloaded', timeout=10000)
-            return await page.query_selector(selector)
+            return await queryable.evaluate(expression, arg)
         except PlaywrightError as e:
             if 'Execution context was destroyed' in str(e) and attempt < retries - 1:
                 logger.debug(
@@ -26,43 +25,68 @@ async def safe_query(page, selector, retries=3, delay=2):
             raise
 
 
+# scripts returning the first selector that matches an element, or null if none does
+FIND_MATCHING_SELECTOR_JS = (
+    '(selectors) => selectors.find((s) => document.querySelector(s) !== null) || null'
+)
+FIND_MATCHING_SELECTOR_IN_ELEMENT_JS = (
+    '(root, selectors) => selectors.find((s) => root.querySelector(s) !== null) || null'
+)
+
+
 # selectors for detecting Cloudflare interstitial challenge (page)
-CF_INTERSTITIAL_INDICATORS_SELECTORS = [
-    'script[src*="/cdn-cgi/challenge-platform/"]',
-]
+CF_INTERSTITIAL_INDICATORS_SELECTORS = ('script[src*="/cdn-cgi/challenge-platform/"]',)
 
 # selectors for detecting Cloudflare turnstile challenge (small embedded captcha)
-CF_TURNSTILE_INDICATORS_SELECTORS = [
+CF_TURNSTILE_INDICATORS_SELECTORS = (
     'input[name="cf-turnstile-response"]',
     'script[src*="challenges.cloudflare.com/turnstile/v0"]',
-]
+)
+
+# indicator selectors by challenge type, passed to the browser as lists
+_SELECTORS_BY_TYPE: Dict[str, List[str]] = {
+    'turnstile': list(CF_TURNSTILE_INDICATORS_SELECTORS),
+    'interstitial': list(CF_INTERSTITIAL_INDICATORS_SELECTORS),
+}
 
 
 async def detect_cloudflare_challenge(
     queryable: Union[Page, Frame, ElementHandle],
     challenge_type: Literal['turnstile', 'interstitial'] = 'turnstile',
+    timeout: float = 1.5,
 ) -> bool:
     """
     Detect if a Cloudflare challenge is present in the provided queryable object by checking for specific predefined selectors
 
     :param queryable: Page, Frame, ElementHandle
     :param challenge_type: Type of challenge to detect ('turnstile' or 'interstitial')
+    :param timeout: Maximum time in seconds to wait for the page to answer, if it doesn't the challenge is assumed to be present
     :return: True if Cloudflare challenge is detected, False otherwise
     """
 
-    selectors = (
-        CF_TURNSTILE_INDICATORS_SELECTORS
-        if challenge_type == 'turnstile'
-        else CF_INTERSTITIAL_INDICATORS_SELECTORS
+    selectors = _SELECTORS_BY_TYPE[challenge_type]
+
+    # test all selectors in a single round-trip
+    expression = (
+        FIND_MATCHING_SELECTOR_IN_ELEMENT_JS
+        if isinstance(queryable, ElementHandle)
+        else FIND_MATCHING_SELECTOR_JS
     )
-    for selector in selectors:
-        # element = await queryable.query_selector(selector)
-        element = await safe_query(queryable, selector)
-        if not element:
-            continue
+    try:
+        # short retry delay so a navigation in progress is still retried within the timeout
+        selector = await asyncio.wait_for(
+            safe_evaluate(queryable, expression, selectors, delay=0.5), timeout
+        )
+    except asyncio.TimeoutError:
+        # a stuck page can't be confirmed as solved
         logger.debug(
-            f'Cloudflare {challenge_type} challenge detected by selector: {selector}'
+            f'Cloudflare {challenge_type} detection timed out after {timeout}s, assuming challenge is present'
         )
         return True
+    if not selector:
+        return False
 
-    return False
+    logger.debug(
+        f'Cloudflare {challenge_type} challenge detected by selector: {selector}'
+    )
+    return True
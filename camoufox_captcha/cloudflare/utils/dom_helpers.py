@@ -1,25 +1,25 @@
 import asyncio
+import logging
 from typing import Optional, List, Tuple
 
 from playwright.async_api import Frame, ElementHandle
 
-from camoufox_captcha.common.shadow_root import search_shadow_root_elements
+from camoufox_captcha.common.shadow_root import wait_for_shadow_root_element
 
-from utils.logger import Logger
-
-logger = Logger().get_logger()
+# shared with the scraper, configured by utils.logger.Logger
+logger = logging.getLogger('Upwork')
 
 
 async def get_ready_checkbox(
     iframes: List[Frame], delay: int, attempts: int
 ) -> Optional[Tuple[Frame, ElementHandle]]:
     """
-    Accepts a list of Cloudflare iframes, sorts out detached ones, collects checkboxes from the remaining iframes,
-    and waits until at least one checkbox is found and ready to be clicked (visible)
+    Accepts a list of Cloudflare iframes, sorts out detached ones and waits in all remaining iframes at once
+    until a checkbox is found and ready to be clicked (visible). Returns as soon as the first checkbox is ready
 
     :param iframes: Cloudflare iframes
-    :param delay: Delay in seconds between attempts to find the checkbox
-    :param attempts: Maximum number of attempts to find the checkbox
+    :param delay: Delay in seconds per attempt to find the checkbox
+    :param attempts: Maximum number of attempts to find the checkbox, the total wait is delay * attempts seconds
     :return: [checkboxes Frame, checkboxes ElementHandle] if checkbox is found and ready, None otherwise
     """
 
@@ -27,46 +27,38 @@ async def get_ready_checkbox(
     if attempts <= 0:
         attempts = 1
 
-    for attempt in range(attempts):
-        try:
-            checkboxes = []
-
-            # search for checkboxes in each iframe
-            for iframe in iframes:
-                try:
-                    if iframe.is_detached():  # skip detached iframes
-                        continue
-
-                    iframe_checkboxes = await search_shadow_root_elements(
-                        iframe, 'input[type="checkbox"]'
-                    )
-
-                    # add found checkboxes to the list with their parent iframe
-                    checkboxes += [
-                        (iframe, iframe_checkbox)
-                        for iframe_checkbox in iframe_checkboxes
-                    ]
-                except Exception as e:
-                    logger.debug(f'Error searching for checkboxes in iframe: {e}')
-
-            logger.debug(
-                f'Found {len(checkboxes)} checkboxes in {len(iframes)} Cloudflare iframes'
+    timeout = delay * attempts * 1000
+
+    # wait for a visible checkbox in each iframe concurrently
+    tasks = {
+        asyncio.ensure_future(
+            wait_for_shadow_root_element(iframe, 'input[type="checkbox"]', timeout)
+        ): iframe
+        for iframe in iframes
+        if not iframe.is_detached()  # skip detached iframes
+    }
+    logger.debug(f'Waiting for Cloudflare checkbox input in {len(tasks)} iframes...')
+
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
             )
-
-            # filter checkboxes that are visible and ready to be clicked
-            visible_checkboxes = []
-            for iframe, checkbox in checkboxes:
-                if await checkbox.is_visible():
-                    visible_checkboxes.append((iframe, checkbox))
-
-            if visible_checkboxes:
-                logger.debug('Checkbox input is ready to be clicked')
-                return visible_checkboxes[0]  # return the first visible checkbox
-
-            logger.debug('Waiting for Cloudflare checkbox input...')
-            await asyncio.sleep(delay)
-        except Exception as e:
-            logger.debug(f'Error while waiting for checkbox: {e}')
+            for task in done:
+                if task.exception():
+                    logger.debug(
+                        f'Error while waiting for checkbox in iframe: {task.exception()}'
+                    )
+                    continue
+
+                checkbox = task.result()
+                if checkbox:
+                    logger.debug('Checkbox input is ready to be clicked')
+                    return tasks[task], checkbox
+    finally:
+        for task in pending:
+            task.cancel()
 
     logger.debug('Max attempts reached while waiting for Cloudflare checkbox input')
     return None
@@ -1,60 +1,115 @@
-from typing import Union, List, Optional
+import asyncio
+import logging
+from typing import Dict, Union, List, Optional, Tuple
+from weakref import WeakKeyDictionary
 
-from playwright.async_api import ElementHandle, Page, Frame
+from playwright.async_api import ElementHandle, JSHandle, Page, Frame
 
-from utils.logger import Logger
+# shared with the scraper, configured by utils.logger.Logger
+logger = logging.getLogger('Upwork')
 
-logger = Logger().get_logger()
+# elements and matched iframes found per queryable, only valid for the current DOM state
+# (cleared by the solver at the start of every solve attempt)
+_elements_cache: Dict[Tuple[int, str], List[ElementHandle]] = {}
+_iframe_cache: Dict[Tuple[int, str], List[Frame]] = {}
 
+# iframe element -> its content frame, resolved once per element
+_content_frames: 'WeakKeyDictionary[ElementHandle, Optional[Frame]]' = (
+    WeakKeyDictionary()
+)
 
-async def get_shadow_roots(
-    queryable: Union[Page, Frame, ElementHandle],
-) -> List[ElementHandle]:
-    """
-    Get all shadow roots on the page
 
-    :param queryable: Page, Frame, ElementHandle
-    :return: List of shadow roots ElementHandles
-    """
+# script to walk all shadow roots and collect every match from each of them in a single round-trip
+# (the selector is always the last argument, ElementHandle queryables pass themselves first)
+SEARCH_SHADOW_ROOT_ELEMENTS_JS = """
+(...args) => {
+    const selector = args[args.length - 1];
+    const elements = [];
 
-    # script to collect all shadow roots
-    js = """
-    () => {
-        const roots = [];
+    const shadowRootOf = (node) => node.shadowRootUnl || node.shadowRoot;
 
-        function collectShadowRoots(node) {
-            if (!node) return;
+    function searchShadowRoots(node) {
+        if (!node) return;
 
-            if (node.shadowRootUnl) {
-                roots.push(node.shadowRootUnl);
-                node = node.shadowRootUnl;
+        const shadowRoot = shadowRootOf(node);
+        if (shadowRoot) {
+            node = shadowRoot;
+            elements.push(...node.querySelectorAll(selector));
+        }
+
+        for (const el of node.querySelectorAll("*")) {
+            if (shadowRootOf(el)) {
+                searchShadowRoots(el);
             }
+        }
+    }
 
-            for (const el of node.querySelectorAll("*")) {
-                if (el.shadowRootUnl) {
-                    collectShadowRoots(el);
-                }
+    searchShadowRoots(document);
+    return elements;
+}
+"""
+
+# script to find the first visible element by selector within all shadow roots
+WAIT_FOR_SHADOW_ROOT_ELEMENT_JS = """
+(selector) => {
+    const shadowRootOf = (node) => node.shadowRootUnl || node.shadowRoot;
+    const isVisible = (el) =>
+        el.getClientRects().length > 0 && getComputedStyle(el).visibility !== "hidden";
+
+    function searchShadowRoots(node) {
+        if (!node) return null;
+
+        const shadowRoot = shadowRootOf(node);
+        if (shadowRoot) {
+            node = shadowRoot;
+            for (const element of node.querySelectorAll(selector)) {
+                if (isVisible(element)) return element;
             }
         }
 
-        collectShadowRoots(document);
-        console.log(roots);
-        return roots;
+        for (const el of node.querySelectorAll("*")) {
+            if (shadowRootOf(el)) {
+                const element = searchShadowRoots(el);
+                if (element) return element;
+            }
+        }
+        return null;
     }
+
+    return searchShadowRoots(document);
+}
+"""
+
+
+async def _unpack_elements(handle: JSHandle) -> List[ElementHandle]:
     """
+    Convert a JSHandle of an array of nodes to a python list of ElementHandles
 
-    handle = await queryable.evaluate_handle(js)
+    :param handle: JSHandle of the array
+    :return: List of ElementHandles, in array order
+    """
 
-    # convert JSHandle array to python list of ElementHandle
+    # all items come back from a single call, keyed by index (plus the array's 'length')
     properties = await handle.get_properties()
 
-    shadow_roots = []
-    for prop_handle in properties.values():
+    elements = []
+    for name, prop_handle in properties.items():
+        if not name.isdigit():
+            continue
         element = prop_handle.as_element()
         if element:
-            shadow_roots.append(element)
+            elements.append(element)
 
-    return shadow_roots
+    return elements
+
+
+def clear_shadow_root_cache() -> None:
+    """
+    Forget elements and iframes cached by previous searches, e.g. when the DOM may have changed
+    """
+
+    _elements_cache.clear()
+    _iframe_cache.clear()
 
 
 async def search_shadow_root_elements(
@@ -68,29 +123,48 @@ async def search_shadow_root_elements(
     :return: List of ElementHandles that match the selector
     """
 
-    elements = []
+    cache_key = (id(queryable), selector)
+    cached = _elements_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
     try:
-        shadow_roots = await get_shadow_roots(
-            queryable
-        )  # get all shadow roots in the queryable object
-        for shadow_root in shadow_roots:
-            # find all elements by selector within the shadow root
-            element_handle = await shadow_root.evaluate_handle(
-                f"shadow => shadow.querySelector('{selector}')"
-            )
-            if not element_handle:
-                continue
-
-            element = element_handle.as_element()
-            if element:
-                elements.append(element)
+        handle = await queryable.evaluate_handle(
+            SEARCH_SHADOW_ROOT_ELEMENTS_JS, selector
+        )
+        elements = await _unpack_elements(handle)
     except Exception as e:
         logger.debug(f'Error searching for elements: {e}')
+        return []
 
+    _elements_cache[cache_key] = elements
     return elements
 
 
+async def wait_for_shadow_root_element(
+    queryable: Union[Page, Frame], selector: str, timeout: float, polling: float = 250
+) -> Optional[ElementHandle]:
+    """
+    Wait until an element matching the selector is visible within the shadow DOM of the queryable object.
+    The check runs inside the browser, so the wait resolves as soon as the element shows up
+
+    :param queryable: Page, Frame
+    :param selector: CSS selector of the element to wait for
+    :param timeout: Maximum time to wait in milliseconds
+    :param polling: Interval between checks in milliseconds
+    :return: ElementHandle of the first visible matching element
+    :raises TimeoutError: if no visible element appeared within the timeout
+    """
+
+    handle = await queryable.wait_for_function(
+        WAIT_FOR_SHADOW_ROOT_ELEMENT_JS,
+        arg=selector,
+        timeout=timeout,
+        polling=polling,
+    )
+    return handle.as_element()
+
+
 async def search_shadow_root_iframes(
     queryable: Union[Page, Frame, ElementHandle], src_filter: str
 ) -> Optional[List[Frame]]:
@@ -102,21 +176,48 @@ async def search_shadow_root_iframes(
     :return: list of matched iframes or empty list if no iframes found
     """
 
+    # a page already tracks all of its frames, shadow DOM included, so no DOM walk is needed
+    if isinstance(queryable, Page):
+        return [
+            frame
+            for frame in queryable.frames
+            if src_filter in frame.url and not frame.is_detached()
+        ]
+
+    cache_key = (id(queryable), src_filter)
+    cached = _iframe_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    async def match_iframe(iframe_element: ElementHandle) -> List[Frame]:
+        src_prop = await iframe_element.get_property('src')
+        src = await src_prop.json_value()
+
+        if src_filter not in src:
+            return []
+
+        if iframe_element in _content_frames:
+            cf_iframe = _content_frames[iframe_element]
+        else:
+            cf_iframe = await iframe_element.content_frame()
+            _content_frames[iframe_element] = cf_iframe
+        if cf_iframe and cf_iframe.is_detached():  # skip detached iframes
+            return []
+
+        return [cf_iframe]
+
     matched_iframes = []
 
     try:
         iframe_elements = await search_shadow_root_elements(queryable, 'iframe')
-        for iframe_element in iframe_elements:
-            src_prop = await iframe_element.get_property('src')
-            src = await src_prop.json_value()
-
-            if src_filter in src:
-                cf_iframe = await iframe_element.content_frame()
-                if cf_iframe and cf_iframe.is_detached():  # skip detached iframes
-                    continue
-
-                matched_iframes.append(cf_iframe)
+        # check all found iframes concurrently
+        for matched in await asyncio.gather(
+            *(match_iframe(iframe_element) for iframe_element in iframe_elements)
+        ):
+            matched_iframes += matched
     except Exception as e:
         logger.debug(f'Error searching for iframes: {e}')
+        return matched_iframes
 
+    _iframe_cache[cache_key] = matched_iframes
     return matched_iframes
@@ -5,6 +5,7 @@ CLI script for AI-powered job scoring.
 Usage:
     uv run score_jobs.py              # Score all unanalyzed jobs
     uv run score_jobs.py --limit 10   # Score up to 10 jobs
+    uv run score_jobs.py --no-cache   # Ignore cached AI responses
     uv run score_jobs.py --stats      # Show scoring statistics
 """
 
@@ -12,7 +13,8 @@ import argparse
 import json
 
 from utils.ai_scorer import score_unanalyzed_jobs
-from utils.db import get_connection, get_job_count
+from utils.db import get_connection, get_job_count, init_db
+from utils.logger import Logger
 
 
 def show_stats():
@@ -79,14 +81,25 @@ def main():
     parser = argparse.ArgumentParser(description='AI-powered job scoring')
     parser.add_argument('--limit', type=int, default=50, help='Max jobs to score (default: 50)')
     parser.add_argument('--stats', action='store_true', help='Show scoring statistics')
+    parser.add_argument(
+        '--no-cache', action='store_true', help='Call the model even for previously scored prompts'
+    )
     args = parser.parse_args()
 
     if args.stats:
         show_stats()
         return
 
+    # Scoring progress is reported through the shared 'Upwork' logger
+    Logger(level='INFO')
+
+    # Make sure the AI response cache table exists on databases created before it
+    init_db()
+
     # Run scoring
-    results = score_unanalyzed_jobs(limit=args.limit, verbose=True)
+    results = score_unanalyzed_jobs(
+        limit=args.limit, verbose=True, use_cache=False if args.no_cache else None
+    )
 
     if results:
         # Show quick summary of high-scoring jobs
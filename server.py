@@ -2,16 +2,17 @@
 FastAPI server for Job Review UI.
 
 Provides REST API endpoints for the job review interface.
-Run with: uv run server.py
+Run with: uv run server.py (set DEV=1 for auto-reload, WEB_CONCURRENCY for worker count)
 """
 
-import json
+import os
 from pathlib import Path
 from typing import Annotated
 
+import orjson
 import uvicorn
 from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
@@ -20,7 +21,7 @@ from utils.db import (
     DEFAULT_DB_PATH,
     dismiss_job,
     get_active_job_count,
-    get_active_jobs,
+    get_active_jobs_page,
     get_job,
     get_scoring_stats,
     init_db,
@@ -48,38 +49,59 @@ class ScoreResponse(BaseModel):
 
 class JobListResponse(BaseModel):
     jobs: list[dict]
-    total: int
+    total: int | None  # only counted for the first page (no cursor)
     limit: int
     offset: int
+    next_cursor: str | None = None
 
 
 # API endpoints
-@app.get('/api/jobs')
+@app.get('/api/jobs', response_model=JobListResponse)
 def list_jobs(
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
     offset: Annotated[int, Query(ge=0)] = 0,
     sort: Annotated[str, Query()] = 'newest',
     min_score: Annotated[float | None, Query()] = None,
-) -> JobListResponse:
-    """List active (non-dismissed) jobs with pagination and sorting."""
-    jobs = get_active_jobs(limit=limit, offset=offset, sort=sort, min_score=min_score)
-    total = get_active_job_count(min_score=min_score)
+    cursor: Annotated[str | None, Query()] = None,
+) -> Response:
+    """
+    List active (non-dismissed) jobs with pagination and sorting.
 
-    # Parse ai_analysis JSON string to dict for each job
+    Pass `next_cursor` from a response as `cursor` to fetch the following page.
+    """
+    try:
+        jobs, next_cursor = get_active_jobs_page(
+            limit=limit, offset=offset, sort=sort, min_score=min_score, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # Follow-up pages reuse the total from the first one instead of recounting
+    total = get_active_job_count(min_score=min_score) if cursor is None else None
+
+    # Parse ai_analysis JSON string to dict for each job (already trimmed and validated by SQLite)
     for job in jobs:
         if job.get('ai_analysis'):
-            try:
-                job['ai_analysis'] = json.loads(job['ai_analysis'])
-            except json.JSONDecodeError:
-                pass
+            job['ai_analysis'] = orjson.loads(job['ai_analysis'])
         # Parse skills JSON if it's a string
         if job.get('skills') and isinstance(job['skills'], str):
             try:
-                job['skills'] = json.loads(job['skills'])
-            except json.JSONDecodeError:
+                job['skills'] = orjson.loads(job['skills'])
+            except orjson.JSONDecodeError:
                 pass
 
-    return JobListResponse(jobs=jobs, total=total, limit=limit, offset=offset)
+    # Serialize directly, the rows come from our own schema so re-validating them is wasted work
+    return Response(
+        content=orjson.dumps(
+            {
+                'jobs': jobs,
+                'total': total,
+                'limit': limit,
+                'offset': offset,
+                'next_cursor': next_cursor,
+            }
+        ),
+        media_type='application/json',
+    )
 
 
 @app.get('/api/jobs/{job_id}')
@@ -92,14 +114,14 @@ def get_job_detail(job_id: str) -> dict:
     # Parse ai_analysis JSON string to dict
     if job.get('ai_analysis'):
         try:
-            job['ai_analysis'] = json.loads(job['ai_analysis'])
-        except json.JSONDecodeError:
+            job['ai_analysis'] = orjson.loads(job['ai_analysis'])
+        except orjson.JSONDecodeError:
             pass
     # Parse skills JSON
     if job.get('skills') and isinstance(job['skills'], str):
         try:
-            job['skills'] = json.loads(job['skills'])
-        except json.JSONDecodeError:
+            job['skills'] = orjson.loads(job['skills'])
+        except orjson.JSONDecodeError:
             pass
 
     return job
@@ -132,9 +154,10 @@ def score_job_endpoint(job_id: str) -> ScoreResponse:
         raise HTTPException(status_code=404, detail='Job not found')
 
     try:
-        score, analysis = score_job(job)
+        # Re-scoring from the UI asks for a fresh answer, so skip the response cache
+        score, analysis = score_job(job, use_cache=False)
         update_job_score(job_id, score)
-        update_job_analysis(job_id, json.dumps(analysis))
+        update_job_analysis(job_id, orjson.dumps(analysis).decode())
         return ScoreResponse(score=score, analysis=analysis)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f'Scoring failed: {e}')
@@ -170,4 +193,16 @@ def startup_event():
 
 
 if __name__ == '__main__':
-    uvicorn.run('server:app', host='0.0.0.0', port=8000, reload=True)
+    # DEV=1 enables auto-reload (single process); otherwise run one worker per CPU
+    reload = os.environ.get('DEV') == '1'
+    workers = int(os.environ.get('WEB_CONCURRENCY', os.cpu_count() or 2))
+    # Set up the schema once here, before the workers start and run their own startup
+    init_db()
+    migrate_db()
+    uvicorn.run(
+        'server:app',
+        host='0.0.0.0',
+        port=8000,
+        reload=reload,
+        workers=1 if reload else workers,
+    )
@@ -0,0 +1,26 @@
+import unittest
+
+from utils.ai_scorer import SHORT_DESCRIPTION_CHARS, heuristic_score
+
+LONG = 'Build a scraper for our product catalog. ' * (SHORT_DESCRIPTION_CHARS // 20)
+
+
+class HeuristicScoreTest(unittest.TestCase):
+    def meeting_risk(self, description: str) -> int | None:
+        result = heuristic_score({'title': 'Scraper', 'description': description})
+        return result and result[1]['meeting_risk']
+
+    def test_high_risk_phrase(self):
+        self.assertEqual(self.meeting_risk(LONG + 'We run scrum.'), 2)
+
+    def test_matches_whole_words_only(self):
+        self.assertIsNone(self.meeting_risk(LONG + 'Scrumptious results.'))
+        self.assertEqual(self.meeting_risk('Written in asyncio.'), 5)
+
+    def test_mixed_signals_go_to_the_model(self):
+        self.assertIsNone(self.meeting_risk(LONG + 'No scrum, no daily standup.'))
+        self.assertIsNone(self.meeting_risk(LONG + 'Scrum team, but no meetings.'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+
+from utils.attr_extractor import JobAttrExtractor
+
+
+class ExtractFromHtmlContentTest(unittest.TestCase):
+    def extract(self, html: str) -> dict:
+        return JobAttrExtractor().extract_from_html(html)
+
+    def test_single_quoted_attributes(self):
+        page = (
+            "<html><body><a href='/jobs/~0123456789abcdef'>Job</a>"
+            "<span class='air3-skill'>Python, Scraping</span>"
+            "<span class='job-duration'>1 to 3 months</span></body></html>"
+        )
+        extracted = self.extract(page)
+        self.assertEqual(extracted['url'], '/jobs/~0123456789abcdef')
+        self.assertEqual(extracted['skills'], ['Python', 'Scraping'])
+        self.assertEqual(extracted['duration'], '1 to 3 months')
+
+    def test_quote_styles_match(self):
+        page = (
+            '<html><body><a href="/jobs/~0123456789abcdef">Job</a>'
+            '<span class="air3-skill">Python, Scraping</span></body></html>'
+        )
+        self.assertEqual(self.extract(page), self.extract(page.replace('"', "'")))
+
+
+if __name__ == '__main__':
+    unittest.main()
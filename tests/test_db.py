@@ -0,0 +1,62 @@
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from utils.db import get_active_jobs_page, get_writer_connection, init_db
+
+
+class ActiveJobsCursorTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp.name) / 'jobs.db'
+        init_db(self.db_path)
+
+        rng = random.Random(0)
+        # Unrounded scores like the model returns, with ties and NULLs mixed in
+        scores = [rng.uniform(0, 10) for _ in range(40)]
+        scores += scores[:5] + [None] * 5
+        with get_writer_connection(self.db_path) as conn:
+            conn.executemany(
+                'INSERT INTO jobs (job_id, title, score, posted_at) VALUES (?, ?, ?, ?)',
+                [
+                    (str(i), f'Job {i}', score, rng.randrange(3))
+                    for i, score in enumerate(scores)
+                ],
+            )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _page_through(self, sort, limit):
+        job_ids = []
+        cursor = None
+        # A cursor that repeats rows would otherwise page forever
+        for _ in range(200):
+            jobs, cursor = get_active_jobs_page(
+                limit=limit, sort=sort, cursor=cursor, db_path=self.db_path
+            )
+            job_ids.extend(job['job_id'] for job in jobs)
+            if cursor is None:
+                return job_ids
+        self.fail(f'Paging {sort} with limit {limit} did not terminate')
+
+    def test_cursor_pages_match_single_query(self):
+        for sort in ('newest', 'oldest', 'score_high', 'score_low'):
+            for limit in (1, 3, 7):
+                with self.subTest(sort=sort, limit=limit):
+                    everything, _ = get_active_jobs_page(
+                        limit=1000, sort=sort, db_path=self.db_path
+                    )
+                    self.assertEqual(
+                        self._page_through(sort, limit),
+                        [job['job_id'] for job in everything],
+                    )
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(ValueError):
+            get_active_jobs_page(cursor='not-a-cursor', db_path=self.db_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,18 +5,33 @@ Scores jobs 1-10 with focus on meeting-averse jobs for async-first agency.
 Uses cheap models for bulk scoring, expensive models reserved for proposal generation.
 """
 
+import asyncio
+import atexit
+import functools
+import hashlib
 import json
+import logging
 import os
+import random
+import re
+import threading
 import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 
 import httpx
+import orjson
 import toml
 from dotenv import load_dotenv
 
 # Load .env file from project root
 load_dotenv(Path(__file__).parent.parent / '.env')
 
+# shared with the scraper, configured by utils.logger.Logger
+logger = logging.getLogger('Upwork')
+
 # Scoring weights - meeting_risk is dominant factor
 SCORING_WEIGHTS = {
     'meeting_risk': 0.5,  # 50% - async-first priority
@@ -24,6 +39,9 @@ SCORING_WEIGHTS = {
     'agency_fit': 0.2,  # 20% - good for outsourcing
 }
 
+# Bump whenever the scoring prompts change, so cached responses to the old prompts aren't reused
+PROMPT_VERSION = 'v1'
+
 SCORING_SYSTEM_PROMPT = """You are a job classifier for an async-first software agency.
 
 Analyze the job and output ONLY valid JSON (no markdown, no explanation):
@@ -56,20 +74,118 @@ SCORING_USER_PROMPT = """TITLE: {title}
 DESCRIPTION:
 {description}"""
 
+# Meeting phrases from the scoring guide above, used to score obvious jobs locally
+HIGH_MEETING_RISK_PHRASES = (
+    'daily standup',
+    'video call required',
+    'must overlap hours',
+    'real-time collaboration',
+    'scrum',
+    'agile ceremonies',
+)
+MEDIUM_MEETING_RISK_PHRASES = ('weekly sync', 'occasional calls', 'available for meetings')
+LOW_MEETING_RISK_PHRASES = ('async', 'text-based', 'flexible timezone', 'no meetings', 'autonomous')
+
+# The start of a description is enough to classify it, longer ones are cut here (~750 tokens)
+MAX_DESC_CHARS = 3000
+
+# Descriptions shorter than this don't carry enough signal to be worth a model call
+SHORT_DESCRIPTION_CHARS = 200
+
+# Job columns the scoring prompt is built from
+SCORING_JOB_COLUMNS = ['job_id', 'title', 'description']
+
+# Markdown code fence some models wrap their JSON in: ```json ... ```
+_FENCE_RE = re.compile(r'```[^\n]*\n?(.*?)(?:\n?```)?\Z', re.DOTALL)
+
+
+def _phrases_re(phrases: tuple[str, ...], prefix: str = '') -> re.Pattern:
+    """Compile phrases into one regex matching any of them as whole words."""
+    return re.compile(rf'\b{prefix}({"|".join(map(re.escape, phrases))})\b')
+
+
+# A high risk phrase can be negated ("no scrum"), the negation is captured in group 1
+_HIGH_MEETING_RISK_RE = _phrases_re(
+    HIGH_MEETING_RISK_PHRASES, prefix=r'((?:no|not|without)\s+)?'
+)
+_MEDIUM_MEETING_RISK_RE = _phrases_re(MEDIUM_MEETING_RISK_PHRASES)
+_LOW_MEETING_RISK_RE = _phrases_re(LOW_MEETING_RISK_PHRASES)
 
-from utils.db import get_unanalyzed_jobs, update_job_analysis, update_job_score
+
+from utils.db import (
+    cache_llm_response,
+    delete_cached_llm_response,
+    get_cached_llm_response,
+    get_unanalyzed_jobs,
+    update_job_scores_batch,
+)
 
 # Config file path
 CONFIG_PATH = Path(__file__).parent.parent / 'config.toml'
 
+OPENROUTER_URL = 'https://openrouter.ai/api/v1/chat/completions'
+DEFAULT_SCORING_MODEL = 'google/gemini-2.0-flash-exp:free'
+
+# Keep connections to OpenRouter open between requests instead of a new TCP + TLS handshake per job
+CLIENT_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+
+# Failed connection attempts are retried by the transport itself, before any backoff
+CONNECT_RETRIES = 2
+
+# Multiplex concurrent scoring requests over one HTTP/2 connection when h2 is installed
+# (optional, `httpx[http2]`), plain HTTP/1.1 keep-alive otherwise
+try:
+    import h2  # noqa: F401
+
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
 
+_client: httpx.Client | None = None
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter: allows bursts of up to `capacity` requests, then `rate` requests per second.
+
+    Shared by every caller, so the limit holds across all concurrent scoring tasks and threads.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token, returning how many seconds to wait until it is actually available."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Going below zero reserves a future token, so waiters are served in order
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        time.sleep(self._reserve())
+
+    async def acquire_async(self):
+        """Wait until a request may be sent, without blocking the event loop."""
+        await asyncio.sleep(self._reserve())
+
+
+@functools.lru_cache(maxsize=1)
 def load_config() -> dict:
-    """Load config.toml file."""
+    """Load config.toml file, once per process (load_config.cache_clear() to re-read it)."""
     if CONFIG_PATH.exists():
         return toml.load(CONFIG_PATH)
     return {}
 
 
+@functools.lru_cache(maxsize=1)
 def get_api_key() -> str:
     """Get OpenRouter API key from env or config."""
     key = os.environ.get('OPENROUTER_API_KEY')
@@ -86,17 +202,152 @@ def get_api_key() -> str:
     )
 
 
+def get_client() -> httpx.Client:
+    """Get the shared OpenRouter client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.Client(
+            timeout=60.0,
+            transport=httpx.HTTPTransport(
+                limits=CLIENT_LIMITS, http2=HTTP2, retries=CONNECT_RETRIES
+            ),
+        )
+        atexit.register(_client.close)
+    return _client
+
+
+@functools.lru_cache(maxsize=1)
+def get_rate_limiter() -> TokenBucket | None:
+    """Get the shared OpenRouter rate limiter from [AI] requests_per_second, None if unlimited."""
+    rate = load_config().get('AI', {}).get('requests_per_second')
+    return TokenBucket(float(rate)) if rate else None
+
+
+@functools.lru_cache
 def get_model(config_key: str, default: str) -> str:
     """Get model name from config or use default."""
     config = load_config()
     return config.get('AI', {}).get(config_key, default)
 
 
+def get_cache_config() -> tuple[bool, float | None]:
+    """
+    Get AI response cache settings from config.
+
+    Returns:
+        Tuple of (enabled, max age in seconds or None to never expire)
+    """
+    config = load_config().get('AI', {})
+    ttl_days = config.get('cache_ttl_days')
+    return config.get('cache', True), ttl_days * 86400 if ttl_days else None
+
+
+def response_cache_key(payload: dict) -> str:
+    """Hash an OpenRouter payload's model and messages into a response cache key."""
+    key_data = {
+        'model': payload['model'],
+        'messages': payload['messages'],
+        'v': PROMPT_VERSION,
+    }
+    return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+
+
+def get_backoff_wait(attempt: int, base: float = 1, cap: float = 32) -> float:
+    """
+    Exponential backoff (base, 2x base, 4x base, ... up to cap seconds) scaled by a random 0.5-1.0,
+    so concurrent requests that failed together don't all retry at the same moment.
+    """
+    return min(cap, base * 2**attempt) * random.uniform(0.5, 1.0)
+
+
+def get_retry_wait(response: httpx.Response, attempt: int, max_wait: float) -> float:
+    """
+    Get how long to wait before retrying a rate limited (429/503) request.
+
+    Uses the server's Retry-After header (seconds or HTTP date) when present,
+    jittered exponential backoff otherwise, capped at max_wait seconds.
+    """
+    retry_after = response.headers.get('Retry-After')
+    wait_time = None
+    if retry_after:
+        try:
+            wait_time = float(retry_after)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                retry_at = None
+            if retry_at is not None:
+                if retry_at.tzinfo is None:
+                    retry_at = retry_at.replace(tzinfo=timezone.utc)
+                wait_time = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    if wait_time is None:
+        wait_time = get_backoff_wait(attempt, base=2)
+    return min(max(wait_time, 0), max_wait)
+
+
+def get_retry_delay(
+    error: Exception, attempt: int, max_retries: int, max_wait: float
+) -> float | None:
+    """
+    Decide whether a failed OpenRouter call is worth another attempt.
+
+    Rate limits (429/503) wait as the server asks, other transient failures (5xx gateway
+    errors, connection problems, malformed replies) back off with jitter. Other client
+    errors (bad key, bad request) and the last attempt are not retried.
+
+    Returns:
+        Seconds to wait before retrying, or None to give up and re-raise
+    """
+    if attempt >= max_retries - 1:
+        return None
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        if status in (429, 503):
+            return get_retry_wait(error.response, attempt, max_wait)
+        if status in (500, 502, 504):
+            return get_backoff_wait(attempt)
+        return None
+    if isinstance(error, (httpx.RequestError, KeyError)):
+        return get_backoff_wait(attempt)
+    return None
+
+
+def build_openrouter_request(
+    messages: list[dict], model: str = None, temperature: float = 0, api_key: str = None
+) -> tuple[dict, dict]:
+    """
+    Build the (headers, payload) pair for an OpenRouter chat completion.
+    Model and API key are looked up in config when not passed in.
+    """
+    if model is None:
+        model = get_model('scoring_model', DEFAULT_SCORING_MODEL)
+
+    if api_key is None:
+        api_key = get_api_key()
+
+    headers = {
+        'Authorization': f'Bearer {api_key}',
+        'Content-Type': 'application/json',
+        'HTTP-Referer': 'https://github.com/utof/Upwork-Job-Scraper',
+    }
+
+    payload = {
+        'model': model,
+        'messages': messages,
+        'temperature': temperature,
+    }
+    return headers, payload
+
+
 def call_openrouter(
     messages: list[dict],
     model: str = None,
     temperature: float = 0,
     max_retries: int = 3,
+    use_cache: bool = None,
+    max_wait: float = 60,
+    api_key: str = None,
 ) -> str:
     """
     Call OpenRouter API with retry logic.
@@ -106,55 +357,115 @@ def call_openrouter(
         model: Model to use (defaults to scoring_model from config)
         temperature: Temperature for generation (0 for deterministic)
         max_retries: Number of retries on failure
+        use_cache: Reuse and store responses in the cache (defaults to cache from config),
+            only calls with temperature 0 and responses that parse are ever cached
+        max_wait: Longest wait in seconds before retrying a rate limited request
+        api_key: OpenRouter API key (defaults to get_api_key())
 
     Returns:
         Response content as string
     """
-    if model is None:
-        model = get_model('scoring_model', 'google/gemini-2.0-flash-exp:free')
+    headers, payload = build_openrouter_request(messages, model, temperature, api_key)
+    cache_enabled, cache_max_age = get_cache_config()
+    cache_key = None
+    if (cache_enabled if use_cache is None else use_cache) and temperature == 0:
+        cache_key = response_cache_key(payload)
+        cached = get_cached_llm_response(cache_key, max_age=cache_max_age)
+        if cached is not None:
+            if is_valid_ai_response(cached):
+                return cached
+            delete_cached_llm_response(cache_key)
+
+    limiter = get_rate_limiter()
+    for attempt in range(max_retries):
+        try:
+            if limiter:
+                limiter.acquire()
+            response = get_client().post(OPENROUTER_URL, headers=headers, json=payload)
+            response.raise_for_status()
+            data = response.json()
+            content = data['choices'][0]['message']['content']
+            if cache_key and is_valid_ai_response(content):
+                cache_llm_response(cache_key, PROMPT_VERSION, payload['model'], content)
+            return content
+
+        except (httpx.HTTPStatusError, httpx.RequestError, KeyError) as e:
+            wait_time = get_retry_delay(e, attempt, max_retries, max_wait)
+            if wait_time is None:
+                raise
+            reason = (
+                f'HTTP {e.response.status_code}' if isinstance(e, httpx.HTTPStatusError) else e
+            )
+            logger.warning(f'Request failed ({reason}), retrying in {wait_time:.1f}s...')
+            time.sleep(wait_time)
 
-    api_key = get_api_key()
+    raise RuntimeError(f'Failed after {max_retries} retries')
 
-    headers = {
-        'Authorization': f'Bearer {api_key}',
-        'Content-Type': 'application/json',
-        'HTTP-Referer': 'https://github.com/utof/Upwork-Job-Scraper',
-    }
 
-    payload = {
-        'model': model,
-        'messages': messages,
-        'temperature': temperature,
-    }
+async def call_openrouter_async(
+    client: httpx.AsyncClient,
+    messages: list[dict],
+    model: str = None,
+    temperature: float = 0,
+    max_retries: int = 3,
+    use_cache: bool = None,
+    max_wait: float = 60,
+    api_key: str = None,
+) -> str:
+    """
+    Async version of call_openrouter, sending the request on a shared client.
+
+    Args:
+        client: httpx.AsyncClient to send the request with
+        messages: List of message dicts with 'role' and 'content'
+        model: Model to use (defaults to scoring_model from config)
+        temperature: Temperature for generation (0 for deterministic)
+        max_retries: Number of retries on failure
+        use_cache: Reuse and store responses in the cache (defaults to cache from config),
+            only calls with temperature 0 and responses that parse are ever cached
+        max_wait: Longest wait in seconds before retrying a rate limited request
+        api_key: OpenRouter API key (defaults to get_api_key())
 
+    Returns:
+        Response content as string
+    """
+    headers, payload = build_openrouter_request(messages, model, temperature, api_key)
+    cache_enabled, cache_max_age = get_cache_config()
+    cache_key = None
+    if (cache_enabled if use_cache is None else use_cache) and temperature == 0:
+        cache_key = response_cache_key(payload)
+        cached = await asyncio.to_thread(
+            get_cached_llm_response, cache_key, max_age=cache_max_age
+        )
+        if cached is not None:
+            if is_valid_ai_response(cached):
+                return cached
+            await asyncio.to_thread(delete_cached_llm_response, cache_key)
+
+    limiter = get_rate_limiter()
     for attempt in range(max_retries):
         try:
-            with httpx.Client(timeout=60.0) as client:
-                response = client.post(
-                    'https://openrouter.ai/api/v1/chat/completions',
-                    headers=headers,
-                    json=payload,
+            if limiter:
+                await limiter.acquire_async()
+            response = await client.post(OPENROUTER_URL, headers=headers, json=payload)
+            response.raise_for_status()
+            data = response.json()
+            content = data['choices'][0]['message']['content']
+            if cache_key and is_valid_ai_response(content):
+                await asyncio.to_thread(
+                    cache_llm_response, cache_key, PROMPT_VERSION, payload['model'], content
                 )
-                response.raise_for_status()
-                data = response.json()
-                return data['choices'][0]['message']['content']
-
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 429:
-                # Rate limited - wait and retry
-                wait_time = 2 ** (attempt + 1)
-                print(f'Rate limited, waiting {wait_time}s...')
-                time.sleep(wait_time)
-                continue
-            raise
-
-        except (httpx.RequestError, KeyError) as e:
-            if attempt < max_retries - 1:
-                wait_time = 2 ** attempt
-                print(f'Request failed: {e}, retrying in {wait_time}s...')
-                time.sleep(wait_time)
-                continue
-            raise
+            return content
+
+        except (httpx.HTTPStatusError, httpx.RequestError, KeyError) as e:
+            wait_time = get_retry_delay(e, attempt, max_retries, max_wait)
+            if wait_time is None:
+                raise
+            reason = (
+                f'HTTP {e.response.status_code}' if isinstance(e, httpx.HTTPStatusError) else e
+            )
+            logger.warning(f'Request failed ({reason}), retrying in {wait_time:.1f}s...')
+            await asyncio.sleep(wait_time)
 
     raise RuntimeError(f'Failed after {max_retries} retries')
 
@@ -164,16 +475,19 @@ def parse_ai_response(response: str) -> dict:
     text = response.strip()
 
     # Strip markdown code blocks if present
-    if text.startswith('```'):
-        lines = text.split('\n')
-        # Remove first line (```json or ```)
-        lines = lines[1:]
-        # Remove last line if it's ```
-        if lines and lines[-1].strip() == '```':
-            lines = lines[:-1]
-        text = '\n'.join(lines)
+    fence = _FENCE_RE.match(text)
+    if fence:
+        text = fence.group(1)
+
+    return orjson.loads(text)
 
-    return json.loads(text)
+
+def is_valid_ai_response(response: str) -> bool:
+    """Check that a response parses into an analysis dict, so it can be cached."""
+    try:
+        return isinstance(parse_ai_response(response), dict)
+    except orjson.JSONDecodeError:
+        return False
 
 
 def calculate_score(analysis: dict) -> float:
@@ -185,20 +499,69 @@ def calculate_score(analysis: dict) -> float:
     return round(score, 2)
 
 
-def score_job(job: dict) -> tuple[float, dict]:
+def heuristic_score(job: dict) -> tuple[float, dict] | None:
     """
-    Score a single job using AI.
+    Score a job locally when the answer is obvious without the model: the description
+    is too short to say much, or it asks for meetings outright.
 
     Args:
         job: Job dict with 'title' and 'description'
 
     Returns:
-        Tuple of (score, analysis_dict)
+        Tuple of (score, analysis_dict) like score_job, or None if the job needs the model
     """
+    description = job.get('description') or ''
+    text = f'{job.get("title") or ""}\n{description}'.lower()
+
+    high_matches = _HIGH_MEETING_RISK_RE.findall(text)
+    high = list(
+        dict.fromkeys(phrase for negation, phrase in high_matches if not negation)
+    )
+    negated = any(negation for negation, _ in high_matches)
+    low = list(dict.fromkeys(_LOW_MEETING_RISK_RE.findall(text)))
+    # Mixed signals ("scrum" next to "no meetings" or "no daily standup") go to the model
+    if high and (low or negated):
+        return None
+    is_short = len(description) < SHORT_DESCRIPTION_CHARS
+    if not high and not is_short:
+        return None
+
+    if high:
+        meeting_risk, indicators = 2, high
+    else:
+        medium = list(dict.fromkeys(_MEDIUM_MEETING_RISK_RE.findall(text)))
+        if medium:
+            meeting_risk, indicators = 5, medium
+        elif low:
+            meeting_risk, indicators = 8, low
+        else:
+            meeting_risk, indicators = 5, []
+
+    red_flags = []
+    if is_short:
+        red_flags.append('Very short description')
+    if high:
+        red_flags.append('Requires meetings')
+    analysis = {
+        'meeting_risk': meeting_risk,
+        'scope_clarity': 2 if is_short else 5,
+        'agency_fit': 5,
+        'red_flags': red_flags,
+        'meeting_indicators': indicators,
+        'source': 'heuristic',
+    }
+    return calculate_score(analysis), analysis
+
+
+def build_scoring_messages(job: dict) -> list[dict]:
+    """Build the scoring chat messages for a job, truncating long descriptions."""
     title = job.get('title', 'No title')
     description = job.get('description', 'No description')
+    max_chars = load_config().get('AI', {}).get('max_description_chars', MAX_DESC_CHARS)
+    if description and len(description) > max_chars:
+        description = description[:max_chars]
 
-    messages = [
+    return [
         {'role': 'system', 'content': SCORING_SYSTEM_PROMPT},
         {
             'role': 'user',
@@ -206,7 +569,19 @@ def score_job(job: dict) -> tuple[float, dict]:
         },
     ]
 
-    response = call_openrouter(messages)
+
+def score_job(job: dict, use_cache: bool = None) -> tuple[float, dict]:
+    """
+    Score a single job using AI.
+
+    Args:
+        job: Job dict with 'title' and 'description'
+        use_cache: Reuse a cached response for the same prompt (defaults to cache from config)
+
+    Returns:
+        Tuple of (score, analysis_dict)
+    """
+    response = call_openrouter(build_scoring_messages(job), use_cache=use_cache)
     analysis = parse_ai_response(response)
 
     # Calculate weighted score
@@ -215,67 +590,210 @@ def score_job(job: dict) -> tuple[float, dict]:
     return score, analysis
 
 
-def score_unanalyzed_jobs(limit: int = 50, verbose: bool = True) -> list[dict]:
+async def score_job_async(
+    client: httpx.AsyncClient,
+    job: dict,
+    use_cache: bool = None,
+    api_key: str = None,
+    model: str = None,
+) -> tuple[float, dict]:
+    """
+    Async version of score_job.
+
+    Args:
+        client: httpx.AsyncClient to send the request with
+        job: Job dict with 'title' and 'description'
+        use_cache: Reuse a cached response for the same prompt (defaults to cache from config)
+        api_key: OpenRouter API key (defaults to get_api_key())
+        model: Model to use (defaults to scoring_model from config)
+
+    Returns:
+        Tuple of (score, analysis_dict)
+    """
+    response = await call_openrouter_async(
+        client,
+        build_scoring_messages(job),
+        model=model,
+        use_cache=use_cache,
+        api_key=api_key,
+    )
+    analysis = parse_ai_response(response)
+    return calculate_score(analysis), analysis
+
+
+def get_concurrency(default: int = 10) -> int:
+    """Get the number of concurrent scoring requests from config or use default."""
+    config = load_config()
+    return int(config.get('AI', {}).get('concurrency', default))
+
+
+def score_unanalyzed_jobs(
+    limit: int = 50,
+    verbose: bool = True,
+    concurrency: int = None,
+    use_cache: bool = None,
+) -> list[dict]:
     """
     Score all unanalyzed jobs in the database.
 
     Args:
         limit: Maximum number of jobs to process
         verbose: Print progress
+        concurrency: Maximum number of scoring requests in flight (defaults to concurrency from config)
+        use_cache: Reuse cached responses for identical prompts (defaults to cache from config)
 
     Returns:
         List of dicts with job_id, title, score, and analysis
     """
-    # Check API key upfront before fetching jobs
+    return asyncio.run(
+        score_unanalyzed_jobs_async(
+            limit=limit, verbose=verbose, concurrency=concurrency, use_cache=use_cache
+        )
+    )
+
+
+async def score_unanalyzed_jobs_async(
+    limit: int = 50,
+    verbose: bool = True,
+    concurrency: int = None,
+    use_cache: bool = None,
+) -> list[dict]:
+    """
+    Score all unanalyzed jobs in the database, up to `concurrency` at a time.
+
+    Scores are handed over a queue to a single writer task, which saves them in batched
+    transactions of [AI] write_batch_size jobs while scoring continues.
+
+    Args:
+        limit: Maximum number of jobs to process
+        verbose: Print progress
+        concurrency: Maximum number of scoring requests in flight (defaults to concurrency from config)
+        use_cache: Reuse cached responses for identical prompts (defaults to cache from config)
+
+    Returns:
+        List of dicts with job_id, title, score, and analysis, in job order
+    """
+    # Check API key upfront before fetching jobs, then hand it to every call along with the model
     try:
-        get_api_key()
+        api_key = get_api_key()
     except ValueError as e:
-        print(f'ERROR: {e}')
+        logger.error(e)
         return []
+    score_job_with = functools.partial(
+        score_job_async,
+        use_cache=use_cache,
+        api_key=api_key,
+        model=get_model('scoring_model', DEFAULT_SCORING_MODEL),
+    )
 
-    jobs = get_unanalyzed_jobs(limit=limit)
+    # Only what the prompt needs, not the full rows with their raw_data blobs
+    jobs = get_unanalyzed_jobs(limit=limit, columns=SCORING_JOB_COLUMNS)
 
     if not jobs:
         if verbose:
-            print('No unanalyzed jobs found.')
+            logger.info('No unanalyzed jobs found.')
         return []
 
-    if verbose:
-        print(f'Scoring {len(jobs)} jobs...')
+    # Reposted jobs often share a description, score each distinct description once
+    groups: dict[str, list[dict]] = defaultdict(list)
+    for job in jobs:
+        description = job.get('description') or ''
+        groups[hashlib.sha256(description.encode()).hexdigest()[:16]].append(job)
 
-    results = []
-    for i, job in enumerate(jobs):
-        job_id = job['job_id']
+    if verbose:
+        logger.info(f'Scoring {len(jobs)} jobs...')
+        if len(groups) < len(jobs):
+            logger.info(
+                f'{len(jobs) - len(groups)} share a description with another job '
+                f'(dedup ratio {len(jobs) / len(groups):.2f})'
+            )
+
+    if concurrency is None:
+        concurrency = get_concurrency()
+    semaphore = asyncio.Semaphore(concurrency)
+    done_count = 0
+    write_batch_size = int(load_config().get('AI', {}).get('write_batch_size', 25))
+    # Bounded, so scorers wait for the writer rather than piling up results
+    write_queue: asyncio.Queue = asyncio.Queue(maxsize=2 * concurrency)
+
+    # Obvious jobs (very short, or asking for meetings outright) are scored without the model
+    use_heuristics = load_config().get('AI', {}).get('heuristic_scoring', True)
+
+    async def score_one(
+        client: httpx.AsyncClient, group: list[dict]
+    ) -> tuple[float, dict] | None:
+        nonlocal done_count
+        job = group[0]
         title = job.get('title', 'No title')
-
+        heuristic = heuristic_score(job) if use_heuristics else None
+        if heuristic is not None:
+            score, analysis = heuristic
+        else:
+            async with semaphore:
+                try:
+                    score, analysis = await score_job_with(client, job)
+                except Exception as e:
+                    done_count += 1
+                    logger.error(f'[{done_count}/{len(groups)}] {e} - {title[:50]}')
+                    return None
+        done_count += 1
+        if verbose:
+            meeting_risk = analysis.get('meeting_risk', '?')
+            logger.info(f'[{done_count}/{len(groups)}] {score:.1f} (mtg:{meeting_risk}) - {title[:50]}')
+        analysis_json = orjson.dumps(analysis).decode()
+        for group_job in group:
+            await write_queue.put((group_job['job_id'], score, analysis_json))
+        return score, analysis
+
+    async def score_all(client: httpx.AsyncClient) -> list[tuple[float, dict] | None]:
         try:
-            score, analysis = score_job(job)
-
-            # Store in database
-            update_job_score(job_id, score)
-            update_job_analysis(job_id, json.dumps(analysis))
-
-            results.append({
-                'job_id': job_id,
-                'title': title,
-                'score': score,
-                'analysis': analysis,
-            })
-
-            if verbose:
-                meeting_risk = analysis.get('meeting_risk', '?')
-                print(f'  [{i + 1}/{len(jobs)}] {score:.1f} (mtg:{meeting_risk}) - {title[:50]}')
-
-            # Small delay to be nice to free API tier
-            time.sleep(0.5)
-
-        except Exception as e:
-            print(f'  [{i + 1}/{len(jobs)}] ERROR: {e} - {title[:50]}')
-            continue
+            return await asyncio.gather(
+                *(score_one(client, group) for group in groups.values())
+            )
+        finally:
+            # Tell the writer there is nothing more to come
+            await write_queue.put(None)
+
+    async def write_scores():
+        batch = []
+        while (item := await write_queue.get()) is not None:
+            batch.append(item)
+            if len(batch) >= write_batch_size:
+                await asyncio.to_thread(update_job_scores_batch, batch)
+                batch = []
+        if batch:
+            await asyncio.to_thread(update_job_scores_batch, batch)
+
+    # One pooled client per run (an AsyncClient is bound to the event loop it is used on)
+    async with httpx.AsyncClient(
+        timeout=60.0,
+        transport=httpx.AsyncHTTPTransport(
+            limits=CLIENT_LIMITS, http2=HTTP2, retries=CONNECT_RETRIES
+        ),
+    ) as client:
+        scored, _ = await asyncio.gather(score_all(client), write_scores())
+
+    # Fan each group's score back out to all of its jobs, in job order
+    job_scores = {
+        job['job_id']: group_score
+        for group, group_score in zip(groups.values(), scored)
+        if group_score is not None
+        for job in group
+    }
+    results = [
+        {
+            'job_id': job['job_id'],
+            'title': job.get('title', 'No title'),
+            'score': job_scores[job['job_id']][0],
+            'analysis': job_scores[job['job_id']][1],
+        }
+        for job in jobs
+        if job['job_id'] in job_scores
+    ]
 
     if verbose:
         scored_count = len(results)
         avg_score = sum(r['score'] for r in results) / scored_count if scored_count else 0
-        print(f'\nScored {scored_count}/{len(jobs)} jobs. Average score: {avg_score:.1f}')
+        logger.info(f'Scored {scored_count}/{len(jobs)} jobs. Average score: {avg_score:.1f}')
 
     return results
@@ -5,10 +5,11 @@ This module extracts specific job data fields from HTML strings containing Upwor
 It handles various data sources including JSON embedded in script tags, HTML attributes, and text content.
 """
 
-import json
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+import orjson
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 # Configure logging
@@ -17,69 +18,334 @@ from .logger import Logger
 logger_obj = Logger(level='DEBUG')
 logger = logger_obj.get_logger()
 
+# Patterns are compiled once at import, the extractor runs all of them on every page
+_SCRIPT_PATTERNS = [
+    re.compile(pattern, re.DOTALL)
+    for pattern in (
+        r'window\.__NUXT__\s*=\s*({.*?});',
+        r'window\.__INITIAL_STATE__\s*=\s*({.*?});',
+        r'window\.data\s*=\s*({.*?});',
+        r'window\.job\s*=\s*({.*?});',
+        r'window\.jobData\s*=\s*({.*?});',
+        r'window\.__NUXT__\.data\s*=\s*({.*?});',
+    )
+]
+
+# The fallback scan in _extract_missing_fields also tries the Nuxt state and payload
+_MISSING_FIELD_SCRIPT_PATTERNS = _SCRIPT_PATTERNS + [
+    re.compile(pattern, re.DOTALL)
+    for pattern in (
+        r'window\.__NUXT__\.state\s*=\s*({.*?});',
+        r'window\.__NUXT__\.payload\s*=\s*({.*?});',
+    )
+]
+
+# One pass over the text tells whether any of the window assignments above is present
+# at all, most scripts and pages have none and skip the per-pattern scans entirely
+_SCRIPT_ASSIGNMENT_RE = re.compile(
+    r'window\.(?:__NUXT__(?:\.(?:data|state|payload))?|__INITIAL_STATE__|data|job|jobData)'
+    r'\s*=\s*\{'
+)
+
+# Nuxt data patterns searched for directly in the HTML content
+_NUXT_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'"createdOn":(\d+)',
+        r'"publishTime":(\d+)',
+        r'"totalApplicants":(\d+)',
+        r'"numberOfPositionsToHire":(\d+)',
+        r'"requiredConnects":(\d+)',
+        r'"score":(\d+(?:\.\d+)?)',
+        r'"feedbackCount":(\d+)',
+        r'"totalCharges":(\d+(?:\.\d+)?)',
+        r'"activeAssignmentsCount":(\d+)',
+        r'"hoursCount":(\d+(?:\.\d+)?)',
+        r'"totalJobsWithHires":(\d+)',
+        r'"invitationsSent":(\d+)',
+        r'"totalHired":(\d+)',
+        r'"totalInvitedToInterview":(\d+)',
+        r'"unansweredInvites":(\d+)',
+        r'"openCount":(\d+)',
+        r'"postedCount":(\d+)',
+        r'"title":"([^"]+)"',
+        r'"description":"([^"]+)"',
+        r'"category":"([^"]+)"',
+        r'"name":"([^"]+)"',
+        r'"currencyCode":"([^"]+)"',
+        r'"country":"([^"]+)"',
+        r'"industry":"([^"]+)"',
+        r'"size":"([^"]+)"',
+        r'"city":"([^"]+)"',
+        r'"countryTimezone":"([^"]+)"',
+        r'"contractorTier":"([^"]+)"',
+        r'"label":"([^"]+)"',
+        r'"isContractToHire":(true|false)',
+        r'"isPaymentMethodVerified":(true|false)',
+        r'"isPhoneVerified":(true|false)',
+        r'"isPremium":(true|false)',
+        r'"isEnterprise":(true|false)',
+        # Additional patterns for location data
+        r'"offsetFromUtcMillis":(\d+)',
+        r'"countryTimezone":"([^"]+)"',
+        r'"city":"([^"]+)"',
+        r'"country":"([^"]+)"',
+        r'"industry":"([^"]+)"',
+        r'"size":"([^"]+)"',
+        r'"contractDate":"([^"]+)"',
+        # Look for specific Nuxt data patterns
+        r'"offsetFromUtcMillis":(\d+),',
+        r'"countryTimezone":(\d+),',
+        r'"city":(\d+),',
+        r'"country":(\d+),',
+        r'"industry":(\d+),',
+        r'"size":(\d+),',
+        r'"isPhoneVerified":(\d+),',
+        r'"isContractToHire":(\d+),',
+        r'"questions":(\d+),',
+        r'"durationIdV3":(\d+),',
+        r'"durationLabel":(\d+),',
+        # Additional patterns for missing fields
+        r'"currencyCode":(\d+),',
+        r'"lastBuyerActivity":(\d+),',
+        # Category patterns
+        r'"name":"([^"]+)"',
+        r'"urlSlug":"([^"]+)"',
+        # Look for category data in the format: {"name":84,"urlSlug":85},"Scripts & Utilities","scripts-utilities"
+        r'"Scripts & Utilities"',
+        r'"scripts-utilities"',
+        r'"Web, Mobile & Software Dev"',
+        r'"web-mobile-software-dev"',
+        # Contractor tier pattern
+        r'"contractorTier":(\d+)',
+        # Hourly rate patterns
+        r'\$(\d+(?:\.\d{2})?)',
+        r'hourly[^>]*min[^>]*>(\d+(?:\.\d{2})?)<',
+        r'hourly[^>]*max[^>]*>(\d+(?:\.\d{2})?)<',
+    )
+]
+
+# The pattern searches below run on the raw page, so attribute values may be quoted
+# either way (str(soup) used to normalize them to double quotes)
+_URL_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'href=["\'](/jobs/[^"\']*)["\']',
+        r'href=["\'](/freelance-jobs/[^"\']*)["\']',
+        r'data-test=["\']job-url["\'][^>]*href=["\']([^"\']*)["\']',
+        r'class=["\']job-url["\'][^>]*href=["\']([^"\']*)["\']',
+    )
+]
+
+_SKILLS_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'data-test=["\']skills["\'][^>]*>([^<]+)<',
+        r'class=["\']skills["\'][^>]*>([^<]+)<',
+        r'<span[^>]*class=["\'][^"\']*skill[^"\']*["\'][^>]*>([^<]+)</span>',
+    )
+]
+
+_BUDGET_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'\$(\d+(?:,\d{3})*(?:\.\d{2})?)',
+        r'(\d+(?:,\d{3})*(?:\.\d{2})?)\s*USD',
+        r'budget[^>]*>([^<]+)<',
+    )
+]
+
+_DURATION_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'duration[^>]*>([^<]+)<',
+        r'<span[^>]*class=["\'][^"\']*duration[^"\']*["\'][^>]*>([^<]+)</span>',
+    )
+]
+
+# Explicit duration phrases commonly used by Upwork UI
+_DURATION_PHRASE_RE = re.compile(
+    r'(More than 6 months|3 to 6 months|1 to 3 months|Less than 1 month)',
+    re.IGNORECASE,
+)
+
+_LEVEL_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'level[^>]*>([^<]+)<',
+        r'<span[^>]*class=["\'][^"\']*level[^"\']*["\'][^>]*>([^<]+)</span>',
+        r'(Entry|Intermediate|Expert|Advanced)',
+        r'experience[^>]*level[^>]*>([^<]+)<',
+        r'<div[^>]*class=["\'][^"\']*level[^"\']*["\'][^>]*>([^<]+)</div>',
+    )
+]
+
+_MONETARY_PATTERNS = [
+    re.compile(pattern)
+    for pattern in (
+        r'(\d+(?:\.\d+)?[Kk]?)',  # Numbers with optional K
+        r'(\d+(?:,\d{3})*(?:\.\d{2})?)',  # Numbers with commas
+    )
+]
+
+# Job description containers, in order of preference
+_DESCRIPTION_SELECTORS = [
+    sv.compile(selector)
+    for selector in (
+        'div[data-test="job-description"]',
+        'div[data-test="description"]',
+        'div[data-test="Description"]',  # Handle uppercase D
+        '.job-description',
+        '.description',
+        'section[data-test="description"]',
+        'section[data-test="Description"]',  # Handle uppercase D
+    )
+]
+# All of the above as one selector, so the candidates are found in a single traversal
+_ANY_DESCRIPTION_SELECTOR = sv.compile(
+    ', '.join(selector.pattern for selector in _DESCRIPTION_SELECTORS)
+)
+
+# Client info block (data-qa attributes)
+_RATE_RE = re.compile(r'\$([\d.]+)')
+_HIRE_RATE_RE = re.compile(r'(\d+)% hire rate')
+_SPEND_RE = re.compile(r'\$([\d.]+K?)')
+_HIRES_RE = re.compile(r'(\d+) hires')
+_HOURS_RE = re.compile(r'(\d+) hours')
+_MEMBER_SINCE_RE = re.compile(r'Member since (.+)')
+_HOURLY_RANGE_RE = re.compile(r'\$(\d+(?:\.\d{2})?)\s*-\s*\$(\d+(?:\.\d{2})?)')
+
+# Client local time, either on its own ("12:09 PM") or glued to the city ("Vs10:35 PM")
+_TIME_ONLY_RE = re.compile(r'^\s*\d{1,2}:\d{2}(\s*[AP]M)?\s*$', re.IGNORECASE)
+_TIME_RE = re.compile(r'(\d{1,2}:\d{2}\s*(?:[AP]M)?)', re.IGNORECASE)
+_CITY_TIME_RE = re.compile(
+    r'^(.*?)(?:\D{0,4})?(\d{1,2}:\d{2}\s*(?:[AP]M)?)$', re.IGNORECASE
+)
+
+# Nuxt index mappings, e.g.
+# {"offsetFromUtcMillis":139,"countryTimezone":140,"city":141,"country":142}
+_LOC_MAP_RE = re.compile(
+    r'\{"offsetFromUtcMillis":(\d+),"countryTimezone":(\d+),"city":(\d+),"country":(\d+)\}'
+)
+_INDUSTRY_RE = re.compile(r'\{"industry":(\d+),"size":(\d+)\}')
+_CURRENCY_RE = re.compile(r'"currencyCode":(\d+)\},[^,]*,"([^"]+)"')
+_CATEGORY_RE = re.compile(r'\{"name":(\d+),"urlSlug":(\d+)\},"([^"]+)","([^"]+)"')
+_HOURS_BLOCK_RE = re.compile(
+    r'\{"totalAssignments":(\d+),"activeAssignmentsCount":(\d+),"hoursCount":(\d+),"feedbackCount":(\d+),"score":(\d+),"totalJobsWithHires":(\d+),"totalCharges":(\d+)\}'
+    r'\s*,\s*(\d+)\s*,\s*([\d\.]+)\s*,\s*(\d+)\s*,\s*([\d\.]+)\s*,\s*(\d+)'  # captures: totalAssignmentsVal, hoursVal, feedbackVal, scoreVal, totalJobsWithHiresVal
+)
+
+# Plain or K-suffixed amount such as "19000" or "19.5K"
+_AMOUNT_RE = re.compile(r'^([\d]+(?:\.\d+)?)([Kk])?$')
+
+# Signed integer or decimal count such as "12", "-3" or "4.0"
+_NUMBER_RE = re.compile(r'-?(?:\d+(?:\.\d*)?|\.\d+)')
+
+
+def _may_be_nuxt_index(value: Any) -> bool:
+    """
+    Cheap pre-check before _resolve_nuxt_index, which only resolves non-negative
+    ints and digit strings. Most extracted values are text and are skipped here
+
+    Args:
+        value: Extracted field value
+
+    Returns:
+        True if the value could be a Nuxt index
+    """
+    if isinstance(value, str):
+        return value.isdigit()
+    return isinstance(value, int)
+
 
 class JobAttrExtractor:
     """Extract job data from Upwork HTML content"""
 
-    def __init__(self):
-        # Define the fields we want to extract
-        self.target_fields = [
-            'applicants',
-            'buyer_avgHourlyJobsRate_amount',
-            'buyer_company_contractDate',
+    # Never resolved as Nuxt indices: buyer_hire_rate_pct so numbers like 100 are not
+    # turned into Nuxt values, the rest are correctly extracted from targeted blocks
+    _NO_RESOLVE_FIELDS = frozenset(
+        {
             'buyer_hire_rate_pct',
-            'buyer_jobs_openCount',
-            'buyer_jobs_postedCount',
-            'buyer_location_city',
-            'buyer_location_countryTimezone',
-            'buyer_location_localTime',
-            'buyer_location_offsetFromUtcMillis',
-            'buyer_stats_activeAssignmentsCount',
+            'client_hires',
             'buyer_stats_hoursCount',
+            'client_reviews',
+            'client_rating',
             'buyer_stats_totalJobsWithHires',
-            'category',
-            'categoryGroup_name',
-            'categoryGroup_urlSlug',
-            'category_name',
-            'category_urlSlug',
-            'clientActivity_invitationsSent',
-            'clientActivity_totalHired',
-            'clientActivity_totalInvitedToInterview',
-            'clientActivity_unansweredInvites',
-            'client_company_size',
-            'client_country',
+        }
+    )
+
+    # The fields we want to extract, shared by all instances
+    TARGET_FIELDS = (
+        'applicants',
+        'buyer_avgHourlyJobsRate_amount',
+        'buyer_company_contractDate',
+        'buyer_hire_rate_pct',
+        'buyer_jobs_openCount',
+        'buyer_jobs_postedCount',
+        'buyer_location_city',
+        'buyer_location_countryTimezone',
+        'buyer_location_localTime',
+        'buyer_location_offsetFromUtcMillis',
+        'buyer_stats_activeAssignmentsCount',
+        'buyer_stats_hoursCount',
+        'buyer_stats_totalJobsWithHires',
+        'category',
+        'categoryGroup_name',
+        'categoryGroup_urlSlug',
+        'category_name',
+        'category_urlSlug',
+        'clientActivity_invitationsSent',
+        'clientActivity_totalHired',
+        'clientActivity_totalInvitedToInterview',
+        'clientActivity_unansweredInvites',
+        'client_company_size',
+        'client_country',
+        'client_hires',
+        'client_industry',
+        'client_rating',
+        'client_reviews',
+        'client_total_spent',
+        'connects_required',
+        'contractorTier',
+        'currency',
+        'description',
+        'duration',
+        'enterpriseJob',
+        'fixed_budget_amount',
+        'hourly_max',
+        'hourly_min',
+        'isContractToHire',
+        'job_id',
+        'lastBuyerActivity',
+        'level',
+        'numberOfPositionsToHire',
+        'payment_verified',
+        'phone_verified',
+        'premium',
+        'qualifications',
+        'questions',
+        'skills',
+        'title',
+        'ts_create',
+        'ts_publish',
+        'type',
+        'url',
+        'location_restriction',
+    )
+    _TARGET_SET = frozenset(TARGET_FIELDS)
+
+    # Numeric fields that default to '0' instead of '' when missing
+    _DEFAULT_ZERO_FIELDS = frozenset(
+        {
+            'buyer_avgHourlyJobsRate_amount',
             'client_hires',
-            'client_industry',
-            'client_rating',
-            'client_reviews',
             'client_total_spent',
-            'connects_required',
-            'contractorTier',
-            'currency',
-            'description',
-            'duration',
-            'enterpriseJob',
-            'fixed_budget_amount',
-            'hourly_max',
             'hourly_min',
-            'isContractToHire',
-            'job_id',
-            'lastBuyerActivity',
-            'level',
-            'numberOfPositionsToHire',
-            'payment_verified',
-            'phone_verified',
-            'premium',
-            'qualifications',
-            'questions',
-            'skills',
-            'title',
-            'ts_create',
-            'ts_publish',
-            'type',
-            'url',
-            'location_restriction',
-        ]
+            'hourly_max',
+            'fixed_budget_amount',
+            'connects_required',
+        }
+    )
 
     def extract_from_html(self, html_content: str) -> Dict[str, Any]:
         """
@@ -92,7 +358,7 @@ class JobAttrExtractor:
             Dictionary containing extracted job data
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, 'lxml')
             extracted_data = {}
 
             # Method 1: Extract from JSON in script tags
@@ -100,45 +366,26 @@ class JobAttrExtractor:
             if json_data:
                 extracted_data.update(self._extract_from_json(json_data))
 
-            # Method 2: Extract from HTML attributes and text content
-            html_data = self._extract_from_html_elements(soup)
-            extracted_data.update(html_data)
-
-            # Method 3: Extract from meta tags and other sources
-            meta_data = self._extract_from_meta_tags(soup)
-            extracted_data.update(meta_data)
-
-            # Method 4: Extract from data attributes
-            data_attrs = self._extract_from_data_attributes(soup)
-            extracted_data.update(data_attrs)
+            # Method 2: Extract from the title, meta tags and data-test elements
+            tag_data = self._extract_from_tags(soup)
+            extracted_data.update(tag_data)
 
-            # Method 5: Extract from HTML content and text
-            html_content_data = self._extract_from_html_content(soup)
+            # Method 3: Extract from HTML content and text
+            html_content_data = self._extract_from_html_content(soup, html_content)
             extracted_data.update(html_content_data)
 
-            # Method 6: Parse Nuxt data and resolve indices
+            # Method 4: Parse Nuxt data and resolve indices
             nuxt_data = self._parse_nuxt_data(html_content)
-            nuxt_lookup = {}
+            nuxt_lookup = []
             if nuxt_data:
                 nuxt_lookup = self._build_nuxt_lookup(nuxt_data)
                 # Resolve all extracted values that might be indices
                 for key, value in extracted_data.items():
-                    # Never resolve buyer_hire_rate_pct to avoid turning numbers like 100 into Nuxt indexes
-                    if key == 'buyer_hire_rate_pct':
+                    if key in self._NO_RESOLVE_FIELDS or not _may_be_nuxt_index(value):
                         continue
-                    # Don't resolve fields that were correctly extracted from targeted blocks
-                    if key in [
-                        'client_hires',
-                        'buyer_stats_hoursCount',
-                        'client_reviews',
-                        'client_rating',
-                        'buyer_stats_totalJobsWithHires',
-                    ]:
-                        continue
-                    if value != 'Not found':
-                        resolved_value = self._resolve_nuxt_index(value, nuxt_lookup)
-                        if resolved_value != value:
-                            extracted_data[key] = resolved_value
+                    resolved_value = self._resolve_nuxt_index(value, nuxt_lookup)
+                    if resolved_value != value:
+                        extracted_data[key] = resolved_value
 
             self._extract_missing_fields(html_content, extracted_data, nuxt_lookup)
 
@@ -170,10 +417,8 @@ class JobAttrExtractor:
 
                     # Only proceed if both values are numeric
                     if (
-                        jobs_with_hires_str.replace('.', '').replace('-', '').isdigit()
-                        and total_jobs_posted_str.replace('.', '')
-                        .replace('-', '')
-                        .isdigit()
+                        _NUMBER_RE.fullmatch(jobs_with_hires_str)
+                        and _NUMBER_RE.fullmatch(total_jobs_posted_str)
                     ):
                         jobs_with_hires = int(float(jobs_with_hires_str))
                         total_jobs_posted = int(float(total_jobs_posted_str))
@@ -227,17 +472,9 @@ class JobAttrExtractor:
                     extracted_data['hourly_max'] = '0'
 
             # Ensure all target fields are present with default values if missing
-            for field in self.target_fields:
+            for field in self.TARGET_FIELDS:
                 if field not in extracted_data:
-                    if field in [
-                        'buyer_avgHourlyJobsRate_amount',
-                        'client_hires',
-                        'client_total_spent',
-                        'hourly_min',
-                        'hourly_max',
-                        'fixed_budget_amount',
-                        'connects_required',
-                    ]:
+                    if field in self._DEFAULT_ZERO_FIELDS:
                         extracted_data[field] = '0'
                     elif field == 'payment_verified':
                         extracted_data[field] = False
@@ -253,26 +490,20 @@ class JobAttrExtractor:
     def _extract_json_from_scripts(self, soup: BeautifulSoup) -> Optional[Dict]:
         """Extract JSON data from script tags"""
         try:
-            # Look for common patterns in script tags
-            script_patterns = [
-                r'window\.__NUXT__\s*=\s*({.*?});',
-                r'window\.__INITIAL_STATE__\s*=\s*({.*?});',
-                r'window\.data\s*=\s*({.*?});',
-                r'window\.job\s*=\s*({.*?});',
-                r'window\.jobData\s*=\s*({.*?});',
-                r'window\.__NUXT__\.data\s*=\s*({.*?});',
-            ]
-
+            # Look for common window assignments in script tags
             scripts = soup.find_all('script', type='text/javascript')
             for script in scripts:
                 if script.string:
                     content = script.string
-                    for pattern in script_patterns:
-                        matches = re.findall(pattern, content, re.DOTALL)
+                    assignment = _SCRIPT_ASSIGNMENT_RE.search(content)
+                    if not assignment:
+                        continue
+                    for pattern in _SCRIPT_PATTERNS:
+                        matches = pattern.findall(content, assignment.start())
                         for match in matches:
                             try:
-                                return json.loads(match)
-                            except json.JSONDecodeError:
+                                return orjson.loads(match)
+                            except orjson.JSONDecodeError:
                                 continue
 
             # Also look for JSON in script content without window assignment
@@ -281,8 +512,8 @@ class JobAttrExtractor:
                     content = script.string.strip()
                     if content.startswith('{') and content.endswith('}'):
                         try:
-                            return json.loads(content)
-                        except json.JSONDecodeError:
+                            return orjson.loads(content)
+                        except orjson.JSONDecodeError:
                             continue
 
             return None
@@ -294,69 +525,77 @@ class JobAttrExtractor:
     def _extract_from_json(self, json_data: Dict) -> Dict[str, Any]:
         """Extract target fields from JSON data"""
         extracted = {}
+        target_fields = self._TARGET_SET
+
+        # Depth-first walk with an explicit stack of dict item iterators. Keys are
+        # visited in the same order as a recursive walk, so a later match of the
+        # same field still wins. Only dicts inside lists are descended into
+        if isinstance(json_data, dict):
+            stack = [iter(json_data.items())]
+        elif isinstance(json_data, list):
+            stack = [
+                iter(item.items())
+                for item in reversed(json_data)
+                if isinstance(item, dict)
+            ]
+        else:
+            return extracted
 
-        def search_in_dict(data, path=''):
-            """Recursively search for target fields in nested dictionary"""
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    current_path = f'{path}.{key}' if path else key
+        while stack:
+            for key, value in stack[-1]:
+                if key in target_fields:
+                    extracted[key] = value
+
+                if isinstance(value, dict):
+                    stack.append(iter(value.items()))
+                    break
+                if isinstance(value, list):
+                    stack.extend(
+                        iter(item.items())
+                        for item in reversed(value)
+                        if isinstance(item, dict)
+                    )
+                    break
+            else:
+                stack.pop()
 
-                    # Check if this key matches any target field
-                    for target_field in self.target_fields:
-                        if key == target_field or current_path.endswith(
-                            f'.{target_field}'
-                        ):
-                            extracted[target_field] = value
-
-                    # Recursively search nested dictionaries
-                    if isinstance(value, dict):
-                        search_in_dict(value, current_path)
-                    elif isinstance(value, list):
-                        for i, item in enumerate(value):
-                            if isinstance(item, dict):
-                                search_in_dict(item, f'{current_path}[{i}]')
-            elif isinstance(data, list):
-                for i, item in enumerate(data):
-                    if isinstance(item, dict):
-                        search_in_dict(item, f'{path}[{i}]')
-
-        search_in_dict(json_data)
         return extracted
 
     def _parse_nuxt_data(self, html_content):
         """Parse the __NUXT_DATA__ script tag to extract the data array"""
-        # Look for the __NUXT_DATA__ script tag
-        nuxt_pattern = r'<script[^>]*id="__NUXT_DATA__"[^>]*>(.*?)</script>'
-        match = re.search(nuxt_pattern, html_content, re.DOTALL)
+        # Locate the __NUXT_DATA__ script tag with plain string searches, the JSON
+        # payload is sliced straight out of the page without parsing any HTML
+        json_text = None
+        id_pos = html_content.find('id="__NUXT_DATA__"')
+        if id_pos != -1 and html_content.startswith(
+            '<script', html_content.rfind('<', 0, id_pos)
+        ):
+            start = html_content.find('>', id_pos) + 1
+            end = html_content.find('</script>', start)
+            if start and end != -1:
+                json_text = html_content[start:end]
 
-        if not match:
+        if json_text is None:
             logger.warning('Could not find __NUXT_DATA__ script tag')
             return None
 
         try:
-            # Parse the JSON data
-            nuxt_data = json.loads(match.group(1))
+            # Parse the JSON data, the payload is the bulk of the page so use orjson
+            nuxt_data = orjson.loads(json_text)
             return nuxt_data
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f'Failed to parse __NUXT_DATA__ JSON: {e}')
             return None
 
     def _build_nuxt_lookup(self, nuxt_data):
-        """Build a lookup dictionary from the Nuxt data array"""
-        lookup = {}
-
+        """Validate the Nuxt data array and return it as the index lookup"""
         if not nuxt_data or not isinstance(nuxt_data, list):
             logger.warning('Invalid Nuxt data format')
-            return lookup
-
-        # The Nuxt data is a flat array where each index corresponds to a value
-        # We need to build the lookup from the entire array
-        for i, value in enumerate(nuxt_data):
-            lookup[i] = value
-            if i < 200:  # Only log first 200 entries to avoid spam
-                pass
+            return []
 
-        return lookup
+        # The Nuxt data is a flat array where each index corresponds to a value,
+        # so the array itself is the lookup
+        return nuxt_data
 
     def _resolve_nuxt_index(self, value, nuxt_lookup):
         """Resolve a Nuxt index to its actual value"""
@@ -366,7 +605,7 @@ class JobAttrExtractor:
             index = int(value)
             # Only resolve if the index is within a reasonable range for Nuxt data
             # and the value looks like it could be an index (not a meaningful number)
-            if 0 <= index < len(nuxt_lookup) and index in nuxt_lookup:
+            if 0 <= index < len(nuxt_lookup):
                 resolved = nuxt_lookup[index]
                 # Don't resolve if the resolved value looks like an IP address or other non-meaningful data
                 if (
@@ -383,94 +622,72 @@ class JobAttrExtractor:
                 return resolved
         return value
 
-    def _extract_from_html_elements(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract data from HTML elements"""
-        extracted = {}
-
-        # Extract title from title tag
-        title_tag = soup.find('title')
-        if title_tag:
-            extracted['title'] = title_tag.get_text().strip()
-
-        # Extract description from meta description
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc:
-            extracted['description'] = meta_desc.get('content', '').strip()
-
-        # Look for job-specific data in various HTML elements
-        data_elements = soup.find_all(attrs={'data-test': True})
-        for element in data_elements:
-            data_test = element.get('data-test')
-            if data_test in [
-                'job-title',
-                'job-description',
-                'job-budget',
-                'job-duration',
-            ]:
-                text_content = element.get_text().strip()
-                if text_content:
-                    if data_test == 'job-title':
-                        extracted['title'] = text_content
-                    elif data_test == 'job-description':
-                        extracted['description'] = text_content
-
-        return extracted
+    def _extract_from_tags(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """
+        Extract title and description from the <title> tag, meta tags and
+        data-test elements in a single walk over the document
 
-    def _extract_from_meta_tags(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract data from meta tags"""
-        extracted = {}
+        Document order only decides between candidates of the same kind, the
+        precedence between kinds is applied after the walk: <title> and meta
+        description, then data-test elements, then job/title/description
+        meta tags
 
-        # Look for job-related meta tags
-        meta_tags = soup.find_all('meta')
-        for meta in meta_tags:
-            name = meta.get('name', '').lower()
-            content = meta.get('content', '')
+        Args:
+            soup: Parsed job page
 
-            if 'job' in name or 'title' in name:
+        Returns:
+            Dictionary with the title and description found, if any
+        """
+        page_title = None
+        meta_description = None
+        data_test = {}
+        meta_fields = {}
+
+        for element in soup.find_all(True):
+            tag = element.name
+            if tag == 'meta':
+                name = element.get('name', '')
+                content = element.get('content', '')
+                if name == 'description' and meta_description is None:
+                    meta_description = content.strip()
+                name = name.lower()
                 if 'title' in name:
-                    extracted['title'] = content
-            elif 'description' in name:
-                extracted['description'] = content
-
-        return extracted
+                    meta_fields['title'] = content
+                elif 'job' not in name and 'description' in name:
+                    meta_fields['description'] = content
+            elif tag == 'title':
+                if page_title is None:
+                    page_title = element.get_text().strip()
+            else:
+                field = element.get('data-test')
+                if field == 'job-title' or field == 'job-description':
+                    text_content = element.get_text().strip()
+                    if text_content:
+                        data_test[field[4:]] = text_content
 
-    def _extract_from_data_attributes(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract data from data attributes"""
         extracted = {}
+        if page_title is not None:
+            extracted['title'] = page_title
+        if meta_description is not None:
+            extracted['description'] = meta_description
+        extracted.update(data_test)
+        extracted.update(meta_fields)
+        return extracted
 
-        # Look for elements with data attributes that might contain job data
-        elements_with_data = soup.find_all(
-            attrs=lambda x: x
-            and isinstance(x, dict)
-            and any(attr.startswith('data-') for attr in x.keys())
-        )
-
-        for element in elements_with_data:
-            for attr, value in element.attrs.items():
-                if attr.startswith('data-'):
-                    # Check if this data attribute might contain job information
-                    if any(
-                        field in attr.lower()
-                        for field in [
-                            'job',
-                            'title',
-                            'description',
-                            'budget',
-                            'duration',
-                        ]
-                    ):
-                        # Try to extract meaningful data
-                        if isinstance(value, str) and value.strip():
-                            # Map common data attributes to our target fields
-                            if 'title' in attr.lower():
-                                extracted['title'] = value
-                            elif 'description' in attr.lower():
-                                extracted['description'] = value
+    def _extract_from_html_content(
+        self, soup: BeautifulSoup, html_content: str
+    ) -> Dict[str, Any]:
+        """
+        Extract data from HTML content and text
 
-        return extracted
+        Args:
+            soup: Parsed job page
+            html_content: The raw HTML the soup was parsed from, used for the
+                plain text and pattern searches instead of re-serializing the tree
 
-    def _extract_from_html_content(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract data from HTML content and text"""
+        Returns:
+            Dictionary containing extracted job data
+        """
         extracted = {}
 
         # Extract title from title tag
@@ -478,22 +695,19 @@ class JobAttrExtractor:
         if title_tag:
             extracted['title'] = title_tag.get_text().strip()
 
-        # Look for job description in various elements
-        description_selectors = [
-            'div[data-test="job-description"]',
-            'div[data-test="description"]',
-            'div[data-test="Description"]',  # Handle uppercase D
-            '.job-description',
-            '.description',
-            'section[data-test="description"]',
-            'section[data-test="Description"]',  # Handle uppercase D
-        ]
-
-        for selector in description_selectors:
-            desc_element = soup.select_one(selector)
+        # Look for job description in various elements. One traversal collects the
+        # first element in document order for each selector, same as select_one
+        first_matches = {}
+        for element in _ANY_DESCRIPTION_SELECTOR.iselect(soup):
+            for index, selector in enumerate(_DESCRIPTION_SELECTORS):
+                if index not in first_matches and selector.match(element):
+                    first_matches[index] = element
+
+        for index, selector in enumerate(_DESCRIPTION_SELECTORS):
+            desc_element = first_matches.get(index)
             if desc_element:
                 # For the specific Description structure, look for the p tag inside
-                if 'data-test="Description"' in selector:
+                if 'data-test="Description"' in selector.pattern:
                     p_tag = desc_element.find('p')
                     if p_tag:
                         desc_text = p_tag.get_text().strip()
@@ -517,10 +731,13 @@ class JobAttrExtractor:
                         extracted['description'] = desc_text
                     break
 
-        # Look for job details in various data-test attributes
+        # Look for job details in various data-test attributes. The elements are
+        # also grouped by value for the exact data-test lookups further down
         data_test_elements = soup.find_all(attrs={'data-test': True})
+        elements_by_data_test = {}
         for element in data_test_elements:
             data_test = element.get('data-test', '')
+            elements_by_data_test.setdefault(data_test, []).append(element)
             text_content = element.get_text().strip()
 
             if text_content:
@@ -574,14 +791,14 @@ class JobAttrExtractor:
             if text_content:
                 if data_qa == 'client-hourly-rate':
                     # Extract hourly rate: "$23.45 /hr avg hourly rate paid"
-                    rate_match = re.search(r'\$([\d.]+)', text_content)
+                    rate_match = _RATE_RE.search(text_content)
                     if rate_match:
                         extracted['buyer_avgHourlyJobsRate_amount'] = rate_match.group(
                             1
                         )
                 elif data_qa == 'client-job-posting-stats':
                     # Extract hire rate: "40% hire rate, 5 open jobs"
-                    hire_rate_match = re.search(r'(\d+)% hire rate', text_content)
+                    hire_rate_match = _HIRE_RATE_RE.search(text_content)
                     if hire_rate_match:
                         extracted['buyer_hire_rate_pct'] = hire_rate_match.group(1)
                 elif data_qa == 'client-location':
@@ -594,11 +811,7 @@ class JobAttrExtractor:
                         city_text = city_div.get_text().strip()
                         if city_text and city_text != 'United States':
                             # If the entire text looks like a time (e.g., "6:09" or "12:09 PM"), store as localTime only
-                            if re.match(
-                                r'^\s*\d{1,2}:\d{2}(\s*[AP]M)?\s*$',
-                                city_text,
-                                re.IGNORECASE,
-                            ):
+                            if _TIME_ONLY_RE.match(city_text):
                                 extracted['buyer_location_localTime'] = (
                                     city_text.strip()
                                 )
@@ -606,11 +819,7 @@ class JobAttrExtractor:
                                 continue
                             # Handle cases where city and time are concatenated, possibly with stray letters like "Vs10:35 PM"
                             # Strategy 1: direct split by locating the time token anywhere in the string
-                            time_token = re.search(
-                                r'(\d{1,2}:\d{2}\s*(?:[AP]M)?)',
-                                city_text,
-                                re.IGNORECASE,
-                            )
+                            time_token = _TIME_RE.search(city_text)
                             if time_token:
                                 city_part = city_text[: time_token.start()].strip()
                                 time_part = time_token.group(1).strip()
@@ -619,11 +828,7 @@ class JobAttrExtractor:
                                 extracted['buyer_location_localTime'] = time_part
                             else:
                                 # Strategy 2: pattern city + optional non-digits + time at end
-                                time_match = re.search(
-                                    r'^(.*?)(?:\D{0,4})?(\d{1,2}:\d{2}\s*(?:[AP]M)?)$',
-                                    city_text,
-                                    re.IGNORECASE,
-                                )
+                                time_match = _CITY_TIME_RE.search(city_text)
                                 if time_match:
                                     city_part = time_match.group(1).strip()
                                     time_part = time_match.group(2).strip()
@@ -636,11 +841,7 @@ class JobAttrExtractor:
                                     if len(parts) >= 2:
                                         # Detect a time token anywhere in the remainder
                                         remainder = ' '.join(parts[1:])
-                                        m = re.search(
-                                            r'(\d{1,2}:\d{2}\s*(?:[AP]M)?)',
-                                            remainder,
-                                            re.IGNORECASE,
-                                        )
+                                        m = _TIME_RE.search(remainder)
                                         if m:
                                             extracted['buyer_location_city'] = parts[0]
                                             extracted['buyer_location_localTime'] = (
@@ -650,11 +851,7 @@ class JobAttrExtractor:
                                             extracted['buyer_location_city'] = city_text
                                     else:
                                         # Single token: ensure it's not just a time before assigning as city
-                                        if re.match(
-                                            r'^\s*\d{1,2}:\d{2}(\s*[AP]M)?\s*$',
-                                            city_text,
-                                            re.IGNORECASE,
-                                        ):
+                                        if _TIME_ONLY_RE.match(city_text):
                                             extracted['buyer_location_localTime'] = (
                                                 city_text.strip()
                                             )
@@ -663,25 +860,25 @@ class JobAttrExtractor:
                 elif data_qa == 'client-spend':
                     # Extract total spent: "$19K total spent"
                     # Look for the specific pattern with $ and K in the text content
-                    spend_match = re.search(r'\$([\d.]+K?)', text_content)
+                    spend_match = _SPEND_RE.search(text_content)
                     if spend_match:
                         extracted['client_total_spent'] = (
                             self._normalize_client_total_spent(spend_match.group(1))
                         )
                 elif data_qa == 'client-hires':
                     # Extract hires: "35 hires, 5 active"
-                    hires_match = re.search(r'(\d+) hires', text_content)
+                    hires_match = _HIRES_RE.search(text_content)
                     if hires_match:
                         extracted['client_hires'] = hires_match.group(1)
                 elif data_qa == 'client-hours':
                     # Extract hours: "441 hours"
-                    hours_match = re.search(r'(\d+) hours', text_content)
+                    hours_match = _HOURS_RE.search(text_content)
                     if hours_match:
                         extracted['buyer_stats_hoursCount'] = hours_match.group(1)
                 elif data_qa == 'client-contract-date':
                     # Extract contract date: "Member since Oct 26, 2022"
                     if 'Member since' in text_content:
-                        date_match = re.search(r'Member since (.+)', text_content)
+                        date_match = _MEMBER_SINCE_RE.search(text_content)
                         if date_match:
                             extracted['buyer_company_contractDate'] = date_match.group(
                                 1
@@ -697,28 +894,25 @@ class JobAttrExtractor:
 
         # Look for payment verification status
         # Check for payment verification icon and text
-        payment_verified_elements = soup.find_all(class_='payment-verified')
-        if payment_verified_elements:
+        # Only presence matters, so stop at the first match instead of collecting all
+        if soup.find(class_='payment-verified'):
             extracted['payment_verified'] = True
         else:
             # Alternative check: look for "Payment method verified" text
-            payment_text_elements = soup.find_all(
-                text=lambda text: text and 'Payment method verified' in text
-            )
-            if payment_text_elements:
+            if soup.find(
+                string=lambda text: text and 'Payment method verified' in text
+            ):
                 extracted['payment_verified'] = True
 
         # Look for phone verification status
         # Check for phone verification icon and text
-        phone_verified_elements = soup.find_all(class_='phone-verified')
-        if phone_verified_elements:
+        if soup.find(class_='phone-verified'):
             extracted['phone_verified'] = True
         else:
             # Alternative check: look for "Phone number verified" text
-            phone_text_elements = soup.find_all(
-                text=lambda text: text and 'Phone number verified' in text
-            )
-            if phone_text_elements:
+            if soup.find(
+                string=lambda text: text and 'Phone number verified' in text
+            ):
                 extracted['phone_verified'] = True
 
         # Look for hourly rate ranges in specific HTML structure
@@ -730,23 +924,21 @@ class JobAttrExtractor:
             if parent:
                 rate_text = parent.get_text()
                 # Extract rates like "$10.00 - $25.00"
-                rate_match = re.search(
-                    r'\$(\d+(?:\.\d{2})?)\s*-\s*\$(\d+(?:\.\d{2})?)', rate_text
-                )
+                rate_match = _HOURLY_RANGE_RE.search(rate_text)
                 if rate_match:
                     extracted['hourly_min'] = rate_match.group(1)
                     extracted['hourly_max'] = rate_match.group(2)
                     break
 
         # Look for category information in various formats
-        category_elements = soup.find_all(attrs={'data-test': 'category'})
+        category_elements = elements_by_data_test.get('category', [])
         for element in category_elements:
             text_content = element.get_text().strip()
             if text_content:
                 extracted['category'] = text_content
 
         # Look for skills in various formats
-        skills_elements = soup.find_all(attrs={'data-test': 'skills'})
+        skills_elements = elements_by_data_test.get('skills', [])
         if skills_elements:
             skills_list = []
             for element in skills_elements:
@@ -787,7 +979,7 @@ class JobAttrExtractor:
                 extracted['skills'] = skills_list
 
         # Look for questions
-        questions_elements = soup.find_all(attrs={'data-test': 'questions'})
+        questions_elements = elements_by_data_test.get('questions', [])
         if questions_elements:
             questions_list = []
             for element in questions_elements:
@@ -799,7 +991,7 @@ class JobAttrExtractor:
 
         # Look for specific job information in the content
         # Extract deliverables
-        deliverables = soup.find_all(attrs={'data-test': 'deliverable'})
+        deliverables = elements_by_data_test.get('deliverable', [])
         if deliverables:
             qual_list = []
             for del_item in deliverables:
@@ -809,8 +1001,10 @@ class JobAttrExtractor:
             if qual_list:
                 extracted['qualifications'] = qual_list
 
+        # Lowercase the page once for all the case-insensitive keyword checks below
+        html_lower = html_content.lower()
+
         # Look for job type information (prefer explicit signals, avoid defaulting)
-        html_content = str(soup)
         if 'type' not in extracted:
             # If we captured hourly range earlier, we already set type; as a fallback, infer from other concrete signals
             if 'hourly_min' in extracted or 'hourly_max' in extracted:
@@ -819,10 +1013,9 @@ class JobAttrExtractor:
                 extracted['type'] = 'Fixed'
             else:
                 # As a last resort, look for strong phrases
-                text_lower = html_content.lower()
-                if 'fixed price' in text_lower or 'fixed-price' in text_lower:
+                if 'fixed price' in html_lower or 'fixed-price' in html_lower:
                     extracted['type'] = 'Fixed'
-                elif '/hr' in text_lower or ' per hour' in text_lower:
+                elif '/hr' in html_lower or ' per hour' in html_lower:
                     extracted['type'] = 'Hourly'
 
         # Look for location restriction (Worldwide, U.S. Only, etc.)
@@ -845,43 +1038,27 @@ class JobAttrExtractor:
                             break
 
         # Look for premium job indicators
-        if 'premium' in html_content.lower():
+        if 'premium' in html_lower:
             extracted['premium'] = True
 
         # Look for contract to hire indicators
-        if (
-            'contract to hire' in html_content.lower()
-            or 'contract-to-hire' in html_content.lower()
-        ):
+        if 'contract to hire' in html_lower or 'contract-to-hire' in html_lower:
             extracted['isContractToHire'] = True
 
         # Look for enterprise job indicators
-        if 'enterprise' in html_content.lower():
+        if 'enterprise' in html_lower:
             extracted['enterpriseJob'] = True
 
         # Look for job URL
-        url_patterns = [
-            r'href="(/jobs/[^"]*)"',
-            r'href="(/freelance-jobs/[^"]*)"',
-            r'data-test="job-url"[^>]*href="([^"]*)"',
-            r'class="job-url"[^>]*href="([^"]*)"',
-        ]
-
-        for pattern in url_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
+        for pattern in _URL_PATTERNS:
+            matches = pattern.findall(html_content)
             if matches:
                 extracted['url'] = matches[0]
                 break
 
         # Look for skills in various formats
-        skills_patterns = [
-            r'data-test="skills"[^>]*>([^<]+)<',
-            r'class="skills"[^>]*>([^<]+)<',
-            r'<span[^>]*class="[^"]*skill[^"]*"[^>]*>([^<]+)</span>',
-        ]
-
-        for pattern in skills_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
+        for pattern in _SKILLS_PATTERNS:
+            matches = pattern.findall(html_content)
             if matches:
                 skills_text = matches[0]
                 skills = [
@@ -892,18 +1069,12 @@ class JobAttrExtractor:
                 break
 
         # Look for budget information
-        budget_patterns = [
-            r'\$(\d+(?:,\d{3})*(?:\.\d{2})?)',
-            r'(\d+(?:,\d{3})*(?:\.\d{2})?)\s*USD',
-            r'budget[^>]*>([^<]+)<',
-        ]
-
-        for pattern in budget_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
+        for pattern in _BUDGET_PATTERNS:
+            matches = pattern.findall(html_content)
             if matches:
-                if 'fixed' in html_content.lower():
+                if 'fixed' in html_lower:
                     extracted['fixed_budget_amount'] = matches[0]
-                elif 'hourly' in html_content.lower():
+                elif 'hourly' in html_lower:
                     if 'hourly_min' not in extracted:
                         extracted['hourly_min'] = matches[0]
                     else:
@@ -911,38 +1082,22 @@ class JobAttrExtractor:
                 break
 
         # Look for duration information
-        duration_patterns = [
-            r'duration[^>]*>([^<]+)<',
-            r'<span[^>]*class="[^"]*duration[^"]*"[^>]*>([^<]+)</span>',
-        ]
-
-        for pattern in duration_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
+        for pattern in _DURATION_PATTERNS:
+            matches = pattern.findall(html_content)
             if matches:
                 extracted['duration'] = matches[0].strip()
                 break
 
         # Fallback: explicit duration phrases commonly used by Upwork UI
         if 'duration' not in extracted or not extracted['duration']:
-            duration_phrase_pattern = (
-                r'(More than 6 months|3 to 6 months|1 to 3 months|Less than 1 month)'
-            )
-            m = re.search(duration_phrase_pattern, html_content, re.IGNORECASE)
+            m = _DURATION_PHRASE_RE.search(html_content)
             if m:
                 # Preserve original casing from the match
                 extracted['duration'] = m.group(1)
 
         # Look for level information
-        level_patterns = [
-            r'level[^>]*>([^<]+)<',
-            r'<span[^>]*class="[^"]*level[^"]*"[^>]*>([^<]+)</span>',
-            r'(Entry|Intermediate|Expert|Advanced)',
-            r'experience[^>]*level[^>]*>([^<]+)<',
-            r'<div[^>]*class="[^"]*level[^"]*"[^>]*>([^<]+)</div>',
-        ]
-
-        for pattern in level_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
+        for pattern in _LEVEL_PATTERNS:
+            matches = pattern.findall(html_content)
             if matches:
                 level_value = matches[0].strip()
                 # Only use if it looks like a meaningful level, not CSS
@@ -956,97 +1111,10 @@ class JobAttrExtractor:
         return extracted
 
     def _extract_missing_fields(
-        self, html_content: str, extracted: Dict[str, Any], nuxt_lookup: Dict = None
+        self, html_content: str, extracted: Dict[str, Any], nuxt_lookup: List = None
     ):
         """Enhanced method to extract missing fields using various patterns"""
 
-        # Look for data in script tags with more patterns
-        script_patterns = [
-            r'window\.__NUXT__\s*=\s*({.*?});',
-            r'window\.__INITIAL_STATE__\s*=\s*({.*?});',
-            r'window\.data\s*=\s*({.*?});',
-            r'window\.job\s*=\s*({.*?});',
-            r'window\.jobData\s*=\s*({.*?});',
-            r'window\.__NUXT__\.data\s*=\s*({.*?});',
-            r'window\.__NUXT__\.state\s*=\s*({.*?});',
-            r'window\.__NUXT__\.payload\s*=\s*({.*?});',
-        ]
-
-        # Also look for Nuxt data in the HTML content directly
-        nuxt_patterns = [
-            r'"createdOn":(\d+)',
-            r'"publishTime":(\d+)',
-            r'"totalApplicants":(\d+)',
-            r'"numberOfPositionsToHire":(\d+)',
-            r'"requiredConnects":(\d+)',
-            r'"score":(\d+(?:\.\d+)?)',
-            r'"feedbackCount":(\d+)',
-            r'"totalCharges":(\d+(?:\.\d+)?)',
-            r'"activeAssignmentsCount":(\d+)',
-            r'"hoursCount":(\d+(?:\.\d+)?)',
-            r'"totalJobsWithHires":(\d+)',
-            r'"invitationsSent":(\d+)',
-            r'"totalHired":(\d+)',
-            r'"totalInvitedToInterview":(\d+)',
-            r'"unansweredInvites":(\d+)',
-            r'"openCount":(\d+)',
-            r'"postedCount":(\d+)',
-            r'"title":"([^"]+)"',
-            r'"description":"([^"]+)"',
-            r'"category":"([^"]+)"',
-            r'"name":"([^"]+)"',
-            r'"currencyCode":"([^"]+)"',
-            r'"country":"([^"]+)"',
-            r'"industry":"([^"]+)"',
-            r'"size":"([^"]+)"',
-            r'"city":"([^"]+)"',
-            r'"countryTimezone":"([^"]+)"',
-            r'"contractorTier":"([^"]+)"',
-            r'"label":"([^"]+)"',
-            r'"isContractToHire":(true|false)',
-            r'"isPaymentMethodVerified":(true|false)',
-            r'"isPhoneVerified":(true|false)',
-            r'"isPremium":(true|false)',
-            r'"isEnterprise":(true|false)',
-            # Additional patterns for location data
-            r'"offsetFromUtcMillis":(\d+)',
-            r'"countryTimezone":"([^"]+)"',
-            r'"city":"([^"]+)"',
-            r'"country":"([^"]+)"',
-            r'"industry":"([^"]+)"',
-            r'"size":"([^"]+)"',
-            r'"contractDate":"([^"]+)"',
-            # Look for specific Nuxt data patterns
-            r'"offsetFromUtcMillis":(\d+),',
-            r'"countryTimezone":(\d+),',
-            r'"city":(\d+),',
-            r'"country":(\d+),',
-            r'"industry":(\d+),',
-            r'"size":(\d+),',
-            r'"isPhoneVerified":(\d+),',
-            r'"isContractToHire":(\d+),',
-            r'"questions":(\d+),',
-            r'"durationIdV3":(\d+),',
-            r'"durationLabel":(\d+),',
-            # Additional patterns for missing fields
-            r'"currencyCode":(\d+),',
-            r'"lastBuyerActivity":(\d+),',
-            # Category patterns
-            r'"name":"([^"]+)"',
-            r'"urlSlug":"([^"]+)"',
-            # Look for category data in the format: {"name":84,"urlSlug":85},"Scripts & Utilities","scripts-utilities"
-            r'"Scripts & Utilities"',
-            r'"scripts-utilities"',
-            r'"Web, Mobile & Software Dev"',
-            r'"web-mobile-software-dev"',
-            # Contractor tier pattern
-            r'"contractorTier":(\d+)',
-            # Hourly rate patterns
-            r'\$(\d+(?:\.\d{2})?)',
-            r'hourly[^>]*min[^>]*>(\d+(?:\.\d{2})?)<',
-            r'hourly[^>]*max[^>]*>(\d+(?:\.\d{2})?)<',
-        ]
-
         # Map Nuxt patterns to our target fields
         nuxt_field_mapping = {
             'createdOn': 'ts_create',
@@ -1091,12 +1159,12 @@ class JobAttrExtractor:
         }
 
         # Extract Nuxt data using patterns
-        for pattern in nuxt_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
+        for pattern in _NUXT_PATTERNS:
+            matches = pattern.findall(html_content)
             if matches:
                 # Find which field this pattern corresponds to
                 for nuxt_field, target_field in nuxt_field_mapping.items():
-                    if nuxt_field in pattern:
+                    if nuxt_field in pattern.pattern:
                         # Only set if field is truly missing or has invalid value
                         # For numeric fields, also check if current value is not a valid number
                         should_set_value = (
@@ -1210,41 +1278,36 @@ class JobAttrExtractor:
 
         # Search for location data via Nuxt index mapping present in HTML
         # Example pattern: {"offsetFromUtcMillis":139,"countryTimezone":140,"city":141,"country":142}
-        loc_map_pattern = r'\{"offsetFromUtcMillis":(\d+),"countryTimezone":(\d+),"city":(\d+),"country":(\d+)\}'
-        loc_map_matches = re.findall(loc_map_pattern, html_content)
+        loc_map_matches = _LOC_MAP_RE.findall(html_content)
         if loc_map_matches:
             try:
                 off_idx, tz_idx, city_idx, country_idx = [
                     int(x) for x in loc_map_matches[0]
                 ]
                 if nuxt_lookup:
-                    if off_idx in nuxt_lookup:
+                    if off_idx < len(nuxt_lookup):
                         extracted['buyer_location_offsetFromUtcMillis'] = nuxt_lookup[
                             off_idx
                         ]
-                    if tz_idx in nuxt_lookup:
+                    if tz_idx < len(nuxt_lookup):
                         extracted['buyer_location_countryTimezone'] = nuxt_lookup[
                             tz_idx
                         ]
-                    if city_idx in nuxt_lookup:
+                    if city_idx < len(nuxt_lookup):
                         city_candidate = nuxt_lookup[city_idx]
                         if not (
                             isinstance(city_candidate, str)
-                            and re.match(
-                                r'^\s*\d{1,2}:\d{2}(\s*[AP]M)?\s*$',
-                                city_candidate,
-                                re.IGNORECASE,
-                            )
+                            and _TIME_ONLY_RE.match(city_candidate)
                         ):
                             extracted['buyer_location_city'] = city_candidate
-                    if country_idx in nuxt_lookup:
+                    if country_idx < len(nuxt_lookup):
                         extracted['client_country'] = nuxt_lookup[country_idx]
             except Exception:
                 pass
 
         # Fallback: heuristic based on proximity (kept for legacy pages)
         if nuxt_lookup and 'buyer_location_countryTimezone' not in extracted:
-            for idx, value in nuxt_lookup.items():
+            for idx, value in enumerate(nuxt_lookup):
                 # Detect likely offset millis values by numeric magnitude (~hours in ms)
                 if (
                     isinstance(value, int)
@@ -1252,42 +1315,37 @@ class JobAttrExtractor:
                 ):
                     extracted['buyer_location_offsetFromUtcMillis'] = value
                     if (
-                        idx + 1 in nuxt_lookup
+                        idx + 1 < len(nuxt_lookup)
                         and 'buyer_location_countryTimezone' not in extracted
                     ):
                         extracted['buyer_location_countryTimezone'] = nuxt_lookup[
                             idx + 1
                         ]
                     if (
-                        idx + 2 in nuxt_lookup
+                        idx + 2 < len(nuxt_lookup)
                         and 'buyer_location_city' not in extracted
                     ):
                         city_candidate = nuxt_lookup[idx + 2]
                         if not (
                             isinstance(city_candidate, str)
-                            and re.match(
-                                r'^\s*\d{1,2}:\d{2}(\s*[AP]M)?\s*$',
-                                city_candidate,
-                                re.IGNORECASE,
-                            )
+                            and _TIME_ONLY_RE.match(city_candidate)
                         ):
                             extracted['buyer_location_city'] = city_candidate
-                    if idx + 3 in nuxt_lookup and 'client_country' not in extracted:
+                    if idx + 3 < len(nuxt_lookup) and 'client_country' not in extracted:
                         extracted['client_country'] = nuxt_lookup[idx + 3]
                     break
 
         # Pattern: {"industry":13,"size":13}
-        nuxt_industry_pattern = r'\{"industry":(\d+),"size":(\d+)\}'
-        industry_matches = re.findall(nuxt_industry_pattern, html_content)
+        industry_matches = _INDUSTRY_RE.findall(html_content)
         if industry_matches:
             industry_idx, size_idx = industry_matches[0]
             # Convert string indices to integers
             industry_idx = int(industry_idx)
             size_idx = int(size_idx)
             # Always resolve these indices to actual values if we have Nuxt lookup
-            if nuxt_lookup and industry_idx in nuxt_lookup:
+            if nuxt_lookup and industry_idx < len(nuxt_lookup):
                 extracted['client_industry'] = nuxt_lookup[industry_idx]
-            if nuxt_lookup and size_idx in nuxt_lookup:
+            if nuxt_lookup and size_idx < len(nuxt_lookup):
                 if (
                     'client_company_size' not in extracted
                     or extracted['client_company_size'] == 'Not found'
@@ -1295,21 +1353,15 @@ class JobAttrExtractor:
                     extracted['client_company_size'] = nuxt_lookup[size_idx]
 
         # Pattern: "currencyCode":91},0,"USD"
-        currency_pattern = r'"currencyCode":(\d+)\},[^,]*,"([^"]+)"'
-        currency_matches = re.findall(currency_pattern, html_content)
+        currency_matches = _CURRENCY_RE.findall(html_content)
         if currency_matches:
-            currency_idx, currency_value = currency_matches[0]
-            # Always resolve the currency index to actual value if we have Nuxt lookup
-            if nuxt_lookup and currency_idx in nuxt_lookup:
-                extracted['currency'] = nuxt_lookup[currency_idx]
-            else:
-                # Fallback to the literal value found after the pattern
-                extracted['currency'] = currency_value
+            # The literal value found after the pattern is the currency code itself
+            _, currency_value = currency_matches[0]
+            extracted['currency'] = currency_value
 
         # Look for category and category group data
         # Pattern: {"name":84,"urlSlug":85},"Scripts & Utilities","scripts-utilities"
-        category_pattern = r'\{"name":(\d+),"urlSlug":(\d+)\},"([^"]+)","([^"]+)"'
-        category_matches = re.findall(category_pattern, html_content)
+        category_matches = _CATEGORY_RE.findall(html_content)
         if category_matches:
             name_id, url_slug_id, category_name, category_url_slug = category_matches[0]
             # Always override category fields with the correct values from the pattern
@@ -1319,8 +1371,8 @@ class JobAttrExtractor:
 
         # Look for category group data
         # Pattern: {"name":87,"urlSlug":88},"Web, Mobile & Software Dev","web-mobile-software-dev"
-        category_group_pattern = r'\{"name":(\d+),"urlSlug":(\d+)\},"([^"]+)","([^"]+)"'
-        category_group_matches = re.findall(category_group_pattern, html_content)
+        # Same pattern as the category, the group is the second match
+        category_group_matches = category_matches
         if category_group_matches:
             # Get the second match (category group)
             if len(category_group_matches) > 1:
@@ -1338,23 +1390,26 @@ class JobAttrExtractor:
                 ):
                     extracted['categoryGroup_urlSlug'] = category_group_url_slug
 
-        for pattern in script_patterns:
-            matches = re.findall(pattern, html_content, re.DOTALL)
+        # No pattern can match before the first window assignment, so start there
+        assignment = _SCRIPT_ASSIGNMENT_RE.search(html_content)
+        for pattern in _MISSING_FIELD_SCRIPT_PATTERNS if assignment else ():
+            matches = pattern.findall(html_content, assignment.start())
             for match in matches:
                 try:
-                    json_data = json.loads(match)
+                    json_data = orjson.loads(match)
                     json_extracted = self._extract_from_json(json_data)
                     extracted.update(json_extracted)
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     continue
 
         # Resolve indices to actual values using Nuxt lookup
         if nuxt_lookup:
             for key, value in extracted.items():
-                if value != 'Not found':
-                    resolved_value = self._resolve_nuxt_index(value, nuxt_lookup)
-                    if resolved_value != value:
-                        extracted[key] = resolved_value
+                if not _may_be_nuxt_index(value):
+                    continue
+                resolved_value = self._resolve_nuxt_index(value, nuxt_lookup)
+                if resolved_value != value:
+                    extracted[key] = resolved_value
 
     def _is_valid_value(self, value: str) -> bool:
         """Check if extracted value is valid and not noise"""
@@ -1401,7 +1456,7 @@ class JobAttrExtractor:
         cleaned = str(value).strip().replace('$', '').replace(',', '')
 
         # Check if it's a valid number (with optional K suffix)
-        if re.match(r'^[\d]+(?:\.\d+)?[Kk]?$', cleaned):
+        if _AMOUNT_RE.match(cleaned):
             # Additional validation for reasonable monetary values
             try:
                 if cleaned.endswith(('K', 'k')):
@@ -1440,7 +1495,7 @@ class JobAttrExtractor:
             text = str(value).strip()
             # Remove currency symbol and commas
             text = text.replace('$', '').replace(',', '').strip()
-            m = re.match(r'^([\d]+(?:\.\d+)?)([Kk])?$', text)
+            m = _AMOUNT_RE.match(text)
             if not m:
                 return value
             number_part = float(m.group(1))
@@ -1457,11 +1512,7 @@ class JobAttrExtractor:
         """Extract values from targeted Nuxt mapping block - runs AFTER all Nuxt resolution"""
         # Targeted extraction for buyer_stats_hoursCount from Nuxt mapping with trailing values
         # Example: {"totalAssignments":130,"activeAssignmentsCount":102,"hoursCount":131,"feedbackCount":132,"score":133,"totalJobsWithHires":134,"totalCharges":135},108,3582.33,73,4.35,92,
-        hours_block_pattern = (
-            r'\{"totalAssignments":(\d+),"activeAssignmentsCount":(\d+),"hoursCount":(\d+),"feedbackCount":(\d+),"score":(\d+),"totalJobsWithHires":(\d+),"totalCharges":(\d+)\}'
-            r'\s*,\s*(\d+)\s*,\s*([\d\.]+)\s*,\s*(\d+)\s*,\s*([\d\.]+)\s*,\s*(\d+)'  # captures: totalAssignmentsVal, hoursVal, feedbackVal, scoreVal, totalJobsWithHiresVal
-        )
-        hours_block_match = re.search(hours_block_pattern, html_content)
+        hours_block_match = _HOURS_BLOCK_RE.search(html_content)
         if hours_block_match:
             try:
                 total_assignments_str = hours_block_match.group(8)
@@ -1519,13 +1570,8 @@ class JobAttrExtractor:
                 # by looking for patterns like "167K", "19000", etc.
                 if isinstance(value, str):
                     # Look for monetary patterns in the string
-                    monetary_patterns = [
-                        r'(\d+(?:\.\d+)?[Kk]?)',  # Numbers with optional K
-                        r'(\d+(?:,\d{3})*(?:\.\d{2})?)',  # Numbers with commas
-                    ]
-
-                    for pattern in monetary_patterns:
-                        matches = re.findall(pattern, value)
+                    for pattern in _MONETARY_PATTERNS:
+                        matches = pattern.findall(value)
                         for match in matches:
                             if self._is_valid_monetary_value(match):
                                 extracted['client_total_spent'] = (
@@ -1564,13 +1610,8 @@ class JobAttrExtractor:
                 # If the value is not valid, try to find the first valid monetary value
                 if isinstance(value, str):
                     # Look for monetary patterns in the string
-                    monetary_patterns = [
-                        r'(\d+(?:\.\d+)?[Kk]?)',  # Numbers with optional K
-                        r'(\d+(?:,\d{3})*(?:\.\d{2})?)',  # Numbers with commas
-                    ]
-
-                    for pattern in monetary_patterns:
-                        matches = re.findall(pattern, value)
+                    for pattern in _MONETARY_PATTERNS:
+                        matches = pattern.findall(value)
                         for match in matches:
                             if self._is_valid_monetary_value(match):
                                 extracted['fixed_budget_amount'] = (
@@ -1635,7 +1676,7 @@ class JobAttrExtractor:
             text = str(value).strip()
             # Remove currency symbol and commas
             text = text.replace('$', '').replace(',', '').strip()
-            m = re.match(r'^([\d]+(?:\.\d+)?)([Kk])?$', text)
+            m = _AMOUNT_RE.match(text)
             if not m:
                 return value
             number_part = float(m.group(1))
@@ -5,22 +5,50 @@ Thin abstraction over raw SQLite - easy to swap to PostgreSQL or add ORM later.
 All DB logic lives here, rest of codebase just calls these functions.
 """
 
-import json
+import base64
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 # Default database path (can be overridden)
 DEFAULT_DB_PATH = Path(__file__).parent.parent / 'data' / 'jobs.db'
 
+# Per-connection settings, applied every time a connection is opened.
+# NORMAL sync is safe with WAL (only the last commits can be lost on power loss, never corrupted)
+CONNECTION_PRAGMAS = (
+    'PRAGMA busy_timeout=5000',  # wait for a competing writer instead of failing with SQLITE_BUSY
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',  # 256 MB
+    'PRAGMA cache_size=-65536',  # 64 MB
+)
+
+
+def _is_memory_db(db_path: Path) -> bool:
+    """Check if db_path points to an in-memory database."""
+    return str(db_path) == ':memory:'
+
+
+def _connect(database, **kwargs) -> sqlite3.Connection:
+    """Open a connection with row access by name and CONNECTION_PRAGMAS applied."""
+    conn = sqlite3.connect(database, **kwargs)
+    conn.row_factory = sqlite3.Row  # Access columns by name
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
 
 @contextmanager
 def get_connection(db_path: Path = DEFAULT_DB_PATH):
     """Context manager for database connections."""
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row  # Access columns by name
+    if not _is_memory_db(db_path):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = _connect(db_path)
     try:
         yield conn
         conn.commit()
@@ -28,9 +56,83 @@ def get_connection(db_path: Path = DEFAULT_DB_PATH):
         conn.close()
 
 
+# Read-only connections, one per thread and database
+_reader_local = threading.local()
+
+# Shared write connection per database, only used while holding _write_lock
+_write_lock = threading.Lock()
+_writer_connections: dict[Path, sqlite3.Connection] = {}
+
+
+@contextmanager
+def get_reader_connection(db_path: Path = DEFAULT_DB_PATH):
+    """
+    Context manager for a read-only connection, reused by the calling thread.
+
+    Under WAL readers never wait for the writer, so read endpoints stay responsive
+    while jobs are being inserted or scored.
+    """
+    if _is_memory_db(db_path):
+        with get_connection(db_path) as conn:
+            yield conn
+        return
+    connections = _reader_local.__dict__.setdefault('connections', {})
+    conn = connections.get(db_path)
+    if conn is None:
+        conn = _connect(f'{db_path.resolve().as_uri()}?mode=ro', uri=True)
+        connections[db_path] = conn
+    yield conn
+
+
+@contextmanager
+def get_writer_connection(db_path: Path = DEFAULT_DB_PATH):
+    """
+    Context manager for the shared write connection.
+
+    Writers in this process take turns on one connection instead of racing for the
+    database lock. Commits on success, rolls back on error.
+    """
+    if _is_memory_db(db_path):
+        with get_connection(db_path) as conn:
+            yield conn
+        return
+    with _write_lock:
+        conn = _writer_connections.get(db_path)
+        if conn is None:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = _connect(db_path, check_same_thread=False)
+            _writer_connections[db_path] = conn
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+
+def _create_active_job_indexes(conn: sqlite3.Connection):
+    """
+    Create partial indexes over non-dismissed jobs matching get_active_jobs' ORDER BY clauses,
+    so a page is read in index order instead of sorting the whole table.
+    """
+    conn.execute(
+        'CREATE INDEX IF NOT EXISTS idx_active_posted '
+        'ON jobs(COALESCE(posted_at, 0) DESC, created_at DESC) WHERE dismissed_at IS NULL'
+    )
+    # Also serves the min_score filter
+    conn.execute(
+        'CREATE INDEX IF NOT EXISTS idx_active_score '
+        'ON jobs(score DESC, COALESCE(posted_at, 0) DESC) WHERE dismissed_at IS NULL'
+    )
+
+
 def init_db(db_path: Path = DEFAULT_DB_PATH):
     """Create tables if they don't exist."""
-    with get_connection(db_path) as conn:
+    with get_writer_connection(db_path) as conn:
+        # WAL lets the server read while the scraper writes, and is persisted in the DB file.
+        # In-memory databases can't use it.
+        if not _is_memory_db(db_path):
+            conn.execute('PRAGMA journal_mode=WAL')
         conn.execute("""
             CREATE TABLE IF NOT EXISTS jobs (
                 job_id TEXT PRIMARY KEY,
@@ -124,17 +226,50 @@ def init_db(db_path: Path = DEFAULT_DB_PATH):
         conn.execute('CREATE INDEX IF NOT EXISTS idx_job_id ON jobs(job_id)')
         conn.execute('CREATE INDEX IF NOT EXISTS idx_run_id ON jobs(run_id)')
         conn.execute('CREATE INDEX IF NOT EXISTS idx_posted_at ON jobs(posted_at)')
+        _create_active_job_indexes(conn)
+        # Responses of deterministic AI calls, keyed by a hash of model + prompt
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                hash TEXT PRIMARY KEY,
+                prompt_version TEXT,
+                model TEXT,
+                response TEXT,
+                created_at INTEGER
+            )
+        """)
 
 
 def job_exists(job_id: str, db_path: Path = DEFAULT_DB_PATH) -> bool:
     """Check if a job already exists in the database."""
-    with get_connection(db_path) as conn:
+    with get_reader_connection(db_path) as conn:
         result = conn.execute(
             'SELECT 1 FROM jobs WHERE job_id = ? LIMIT 1', (job_id,)
         ).fetchone()
         return result is not None
 
 
+def job_exists_batch(
+    job_ids: list[str], db_path: Path = DEFAULT_DB_PATH, chunk_size: int = 500
+) -> set[str]:
+    """
+    Check which of the given jobs already exist in the database.
+    Returns the set of existing job IDs.
+
+    IDs are looked up with IN (...) queries of at most chunk_size IDs,
+    staying below SQLite's bound parameter limit.
+    """
+    existing = set()
+    with get_reader_connection(db_path) as conn:
+        for i in range(0, len(job_ids), chunk_size):
+            chunk = job_ids[i : i + chunk_size]
+            placeholders = ', '.join('?' * len(chunk))
+            rows = conn.execute(
+                f'SELECT job_id FROM jobs WHERE job_id IN ({placeholders})', chunk
+            ).fetchall()
+            existing.update(row[0] for row in rows)
+    return existing
+
+
 def _to_int(value) -> int | None:
     """Convert value to int, return None if not possible."""
     if value is None:
@@ -185,10 +320,134 @@ def _to_json(value) -> str | None:
     if value is None:
         return None
     if isinstance(value, (list, dict)):
-        return json.dumps(value)
+        return orjson.dumps(value).decode()
     return str(value) if value else None
 
 
+# Column order must match _job_row()
+_INSERT_JOB_SQL = """
+    INSERT OR IGNORE INTO jobs (
+        job_id, run_id, search_query, title, description, url, type,
+        hourly_min, hourly_max, fixed_budget_amount, currency,
+        duration, level, category, category_name, category_urlSlug,
+        categoryGroup_name, categoryGroup_urlSlug, skills, qualifications,
+        questions, location_restriction, connects_required, contractorTier,
+        numberOfPositionsToHire, applicants,
+        premium, enterpriseJob, isContractToHire,
+        client_country, client_total_spent, client_hires, client_rating,
+        client_reviews, client_company_size, client_industry,
+        payment_verified, phone_verified,
+        buyer_location_city, buyer_location_countryTimezone,
+        buyer_location_localTime, buyer_location_offsetFromUtcMillis,
+        buyer_avgHourlyJobsRate_amount, buyer_company_contractDate,
+        buyer_hire_rate_pct, buyer_jobs_openCount, buyer_jobs_postedCount,
+        buyer_stats_activeAssignmentsCount, buyer_stats_hoursCount,
+        buyer_stats_totalJobsWithHires,
+        clientActivity_invitationsSent, clientActivity_totalHired,
+        clientActivity_totalInvitedToInterview, clientActivity_unansweredInvites,
+        lastBuyerActivity, ts_create, posted_at, raw_data
+    ) VALUES (
+        ?, ?, ?, ?, ?, ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?, ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?, ?,
+        ?, ?,
+        ?, ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?,
+        ?, ?,
+        ?, ?,
+        ?, ?,
+        ?, ?,
+        ?, ?, ?,
+        ?, ?,
+        ?,
+        ?, ?,
+        ?, ?,
+        ?, ?, ?, ?
+    )
+"""
+
+
+def _job_row(
+    job_data: dict[str, Any], run_id: str = None, search_query: str = None
+) -> tuple:
+    """Build the _INSERT_JOB_SQL parameters for a job."""
+    # Store full raw data as JSON for future-proofing
+    raw_data = orjson.dumps(job_data, default=str).decode()
+    return (
+        # Basic info
+        job_data.get('job_id'),
+        run_id,
+        search_query,
+        job_data.get('title'),
+        job_data.get('description'),
+        job_data.get('url'),
+        job_data.get('type'),
+        # Budget/rate
+        job_data.get('hourly_min'),
+        job_data.get('hourly_max'),
+        job_data.get('fixed_budget_amount'),
+        job_data.get('currency'),
+        # Job details
+        job_data.get('duration'),
+        job_data.get('level'),
+        job_data.get('category'),
+        job_data.get('category_name'),
+        job_data.get('category_urlSlug'),
+        job_data.get('categoryGroup_name'),
+        job_data.get('categoryGroup_urlSlug'),
+        _to_json(job_data.get('skills')),
+        _to_json(job_data.get('qualifications')),
+        _to_json(job_data.get('questions')),
+        job_data.get('location_restriction'),
+        _to_int(job_data.get('connects_required')),
+        job_data.get('contractorTier'),
+        _to_int(job_data.get('numberOfPositionsToHire')),
+        _to_int(job_data.get('applicants')),
+        # Job flags
+        _to_bool_int(job_data.get('premium')),
+        _to_bool_int(job_data.get('enterpriseJob')),
+        _to_bool_int(job_data.get('isContractToHire')),
+        # Client info
+        job_data.get('client_country'),
+        job_data.get('client_total_spent'),
+        job_data.get('client_hires'),
+        job_data.get('client_rating'),
+        job_data.get('client_reviews'),
+        job_data.get('client_company_size'),
+        job_data.get('client_industry'),
+        _to_bool_int(job_data.get('payment_verified')),
+        _to_bool_int(job_data.get('phone_verified')),
+        # Buyer location
+        job_data.get('buyer_location_city'),
+        job_data.get('buyer_location_countryTimezone'),
+        job_data.get('buyer_location_localTime'),
+        _to_int(job_data.get('buyer_location_offsetFromUtcMillis')),
+        # Buyer stats
+        job_data.get('buyer_avgHourlyJobsRate_amount'),
+        job_data.get('buyer_company_contractDate'),
+        _to_int(job_data.get('buyer_hire_rate_pct')),
+        _to_int(job_data.get('buyer_jobs_openCount')),
+        _to_int(job_data.get('buyer_jobs_postedCount')),
+        _to_int(job_data.get('buyer_stats_activeAssignmentsCount')),
+        job_data.get('buyer_stats_hoursCount'),
+        _to_int(job_data.get('buyer_stats_totalJobsWithHires')),
+        # Client activity
+        _to_int(job_data.get('clientActivity_invitationsSent')),
+        _to_int(job_data.get('clientActivity_totalHired')),
+        _to_int(job_data.get('clientActivity_totalInvitedToInterview')),
+        _to_int(job_data.get('clientActivity_unansweredInvites')),
+        job_data.get('lastBuyerActivity'),
+        # Timestamps
+        _to_timestamp(job_data.get('ts_create')),
+        _to_timestamp(job_data.get('ts_publish')),
+        # Raw data
+        raw_data,
+    )
+
+
 def insert_job(
     job_data: dict[str, Any],
     run_id: str = None,
@@ -199,129 +458,9 @@ def insert_job(
     Insert a job into the database.
     Returns True if inserted, False if already exists.
     """
-    if job_exists(job_data.get('job_id', ''), db_path):
-        return False
-
-    with get_connection(db_path) as conn:
-        # Store full raw data as JSON for future-proofing
-        raw_data = json.dumps(job_data, default=str)
-
-        conn.execute(
-            """
-            INSERT OR IGNORE INTO jobs (
-                job_id, run_id, search_query, title, description, url, type,
-                hourly_min, hourly_max, fixed_budget_amount, currency,
-                duration, level, category, category_name, category_urlSlug,
-                categoryGroup_name, categoryGroup_urlSlug, skills, qualifications,
-                questions, location_restriction, connects_required, contractorTier,
-                numberOfPositionsToHire, applicants,
-                premium, enterpriseJob, isContractToHire,
-                client_country, client_total_spent, client_hires, client_rating,
-                client_reviews, client_company_size, client_industry,
-                payment_verified, phone_verified,
-                buyer_location_city, buyer_location_countryTimezone,
-                buyer_location_localTime, buyer_location_offsetFromUtcMillis,
-                buyer_avgHourlyJobsRate_amount, buyer_company_contractDate,
-                buyer_hire_rate_pct, buyer_jobs_openCount, buyer_jobs_postedCount,
-                buyer_stats_activeAssignmentsCount, buyer_stats_hoursCount,
-                buyer_stats_totalJobsWithHires,
-                clientActivity_invitationsSent, clientActivity_totalHired,
-                clientActivity_totalInvitedToInterview, clientActivity_unansweredInvites,
-                lastBuyerActivity, ts_create, posted_at, raw_data
-            ) VALUES (
-                ?, ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?,
-                ?, ?, ?, ?, ?,
-                ?, ?, ?, ?,
-                ?, ?, ?, ?,
-                ?, ?,
-                ?, ?, ?,
-                ?, ?, ?, ?,
-                ?, ?, ?,
-                ?, ?,
-                ?, ?,
-                ?, ?,
-                ?, ?,
-                ?, ?, ?,
-                ?, ?,
-                ?,
-                ?, ?,
-                ?, ?,
-                ?, ?, ?, ?
-            )
-        """,
-            (
-                # Basic info
-                job_data.get('job_id'),
-                run_id,
-                search_query,
-                job_data.get('title'),
-                job_data.get('description'),
-                job_data.get('url'),
-                job_data.get('type'),
-                # Budget/rate
-                job_data.get('hourly_min'),
-                job_data.get('hourly_max'),
-                job_data.get('fixed_budget_amount'),
-                job_data.get('currency'),
-                # Job details
-                job_data.get('duration'),
-                job_data.get('level'),
-                job_data.get('category'),
-                job_data.get('category_name'),
-                job_data.get('category_urlSlug'),
-                job_data.get('categoryGroup_name'),
-                job_data.get('categoryGroup_urlSlug'),
-                _to_json(job_data.get('skills')),
-                _to_json(job_data.get('qualifications')),
-                _to_json(job_data.get('questions')),
-                job_data.get('location_restriction'),
-                _to_int(job_data.get('connects_required')),
-                job_data.get('contractorTier'),
-                _to_int(job_data.get('numberOfPositionsToHire')),
-                _to_int(job_data.get('applicants')),
-                # Job flags
-                _to_bool_int(job_data.get('premium')),
-                _to_bool_int(job_data.get('enterpriseJob')),
-                _to_bool_int(job_data.get('isContractToHire')),
-                # Client info
-                job_data.get('client_country'),
-                job_data.get('client_total_spent'),
-                job_data.get('client_hires'),
-                job_data.get('client_rating'),
-                job_data.get('client_reviews'),
-                job_data.get('client_company_size'),
-                job_data.get('client_industry'),
-                _to_bool_int(job_data.get('payment_verified')),
-                _to_bool_int(job_data.get('phone_verified')),
-                # Buyer location
-                job_data.get('buyer_location_city'),
-                job_data.get('buyer_location_countryTimezone'),
-                job_data.get('buyer_location_localTime'),
-                _to_int(job_data.get('buyer_location_offsetFromUtcMillis')),
-                # Buyer stats
-                job_data.get('buyer_avgHourlyJobsRate_amount'),
-                job_data.get('buyer_company_contractDate'),
-                _to_int(job_data.get('buyer_hire_rate_pct')),
-                _to_int(job_data.get('buyer_jobs_openCount')),
-                _to_int(job_data.get('buyer_jobs_postedCount')),
-                _to_int(job_data.get('buyer_stats_activeAssignmentsCount')),
-                job_data.get('buyer_stats_hoursCount'),
-                _to_int(job_data.get('buyer_stats_totalJobsWithHires')),
-                # Client activity
-                _to_int(job_data.get('clientActivity_invitationsSent')),
-                _to_int(job_data.get('clientActivity_totalHired')),
-                _to_int(job_data.get('clientActivity_totalInvitedToInterview')),
-                _to_int(job_data.get('clientActivity_unansweredInvites')),
-                job_data.get('lastBuyerActivity'),
-                # Timestamps
-                _to_timestamp(job_data.get('ts_create')),
-                _to_timestamp(job_data.get('ts_publish')),
-                # Raw data
-                raw_data,
-            ),
-        )
-        return True
+    with get_writer_connection(db_path) as conn:
+        cursor = conn.execute(_INSERT_JOB_SQL, _job_row(job_data, run_id, search_query))
+        return cursor.rowcount > 0
 
 
 def insert_jobs_batch(
@@ -336,23 +475,31 @@ def insert_jobs_batch(
 
     Since jobs are sorted by newest first, once we hit a known job,
     all subsequent jobs are also known.
+
+    All jobs are written in one transaction with a single executemany,
+    so the batch costs one commit instead of one per job.
     """
-    inserted_count = 0
+    jobs = [job for job in jobs if job.get('job_id')]
+    existing_job_ids = job_exists_batch([job['job_id'] for job in jobs], db_path)
+    rows = []
     for job in jobs:
-        job_id = job.get('job_id', '')
-        if not job_id:
-            continue
-        if job_exists(job_id, db_path):
+        if job['job_id'] in existing_job_ids:
             # Hit a known job - stop processing
             break
-        if insert_job(job, run_id, search_query, db_path):
-            inserted_count += 1
-    return inserted_count
+        rows.append(_job_row(job, run_id, search_query))
+    if not rows:
+        return 0
+
+    with get_writer_connection(db_path) as conn:
+        conn.execute('BEGIN IMMEDIATE')
+        # OR IGNORE still guards against duplicates within the batch
+        cursor = conn.executemany(_INSERT_JOB_SQL, rows)
+        return cursor.rowcount
 
 
 def get_job(job_id: str, db_path: Path = DEFAULT_DB_PATH) -> dict | None:
     """Get a single job by ID."""
-    with get_connection(db_path) as conn:
+    with get_reader_connection(db_path) as conn:
         row = conn.execute('SELECT * FROM jobs WHERE job_id = ?', (job_id,)).fetchone()
         if row:
             return dict(row)
@@ -361,7 +508,7 @@ def get_job(job_id: str, db_path: Path = DEFAULT_DB_PATH) -> dict | None:
 
 def get_recent_jobs(limit: int = 50, db_path: Path = DEFAULT_DB_PATH) -> list[dict]:
     """Get most recently posted jobs."""
-    with get_connection(db_path) as conn:
+    with get_reader_connection(db_path) as conn:
         rows = conn.execute(
             'SELECT * FROM jobs ORDER BY COALESCE(posted_at, 0) DESC, created_at DESC LIMIT ?',
             (limit,),
@@ -369,11 +516,17 @@ def get_recent_jobs(limit: int = 50, db_path: Path = DEFAULT_DB_PATH) -> list[di
         return [dict(row) for row in rows]
 
 
-def get_unanalyzed_jobs(limit: int = 10, db_path: Path = DEFAULT_DB_PATH) -> list[dict]:
-    """Get jobs that haven't been analyzed by AI yet, newest posted first."""
-    with get_connection(db_path) as conn:
+def get_unanalyzed_jobs(
+    limit: int = 10, columns: list[str] = None, db_path: Path = DEFAULT_DB_PATH
+) -> list[dict]:
+    """
+    Get jobs that haven't been analyzed by AI yet, newest posted first.
+    Pass columns to load only those instead of full rows (raw_data included).
+    """
+    select = ', '.join(columns) if columns else '*'
+    with get_reader_connection(db_path) as conn:
         rows = conn.execute(
-            '''SELECT * FROM jobs WHERE ai_analysis IS NULL
+            f'''SELECT {select} FROM jobs WHERE ai_analysis IS NULL
                ORDER BY COALESCE(posted_at, 0) DESC, created_at DESC LIMIT ?''',
             (limit,),
         ).fetchall()
@@ -382,35 +535,53 @@ def get_unanalyzed_jobs(limit: int = 10, db_path: Path = DEFAULT_DB_PATH) -> lis
 
 def update_job_score(job_id: str, score: float, db_path: Path = DEFAULT_DB_PATH):
     """Update the score for a job."""
-    with get_connection(db_path) as conn:
+    with get_writer_connection(db_path) as conn:
         conn.execute('UPDATE jobs SET score = ? WHERE job_id = ?', (score, job_id))
 
 
 def update_job_analysis(job_id: str, analysis: str, db_path: Path = DEFAULT_DB_PATH):
     """Update the AI analysis for a job."""
-    with get_connection(db_path) as conn:
+    with get_writer_connection(db_path) as conn:
         conn.execute(
             'UPDATE jobs SET ai_analysis = ? WHERE job_id = ?', (analysis, job_id)
         )
 
 
+def update_job_scores_batch(
+    scores: list[tuple[str, float, str]], db_path: Path = DEFAULT_DB_PATH
+) -> int:
+    """
+    Update score and AI analysis for many jobs in one transaction.
+    Takes (job_id, score, analysis) tuples, returns number of jobs updated.
+    """
+    if not scores:
+        return 0
+    with get_writer_connection(db_path) as conn:
+        conn.execute('BEGIN IMMEDIATE')
+        cursor = conn.executemany(
+            'UPDATE jobs SET score = ?, ai_analysis = ? WHERE job_id = ?',
+            [(score, analysis, job_id) for job_id, score, analysis in scores],
+        )
+        return cursor.rowcount
+
+
 def get_job_count(db_path: Path = DEFAULT_DB_PATH) -> int:
     """Get total number of jobs in database."""
-    with get_connection(db_path) as conn:
+    with get_reader_connection(db_path) as conn:
         result = conn.execute('SELECT COUNT(*) FROM jobs').fetchone()
         return result[0] if result else 0
 
 
 def delete_by_run_id(run_id: str, db_path: Path = DEFAULT_DB_PATH) -> int:
     """Delete all jobs from a specific run. Returns number deleted."""
-    with get_connection(db_path) as conn:
+    with get_writer_connection(db_path) as conn:
         cursor = conn.execute('DELETE FROM jobs WHERE run_id = ?', (run_id,))
         return cursor.rowcount
 
 
 def get_jobs_by_run_id(run_id: str, db_path: Path = DEFAULT_DB_PATH) -> list[dict]:
     """Get all jobs from a specific run."""
-    with get_connection(db_path) as conn:
+    with get_reader_connection(db_path) as conn:
         rows = conn.execute(
             'SELECT * FROM jobs WHERE run_id = ? ORDER BY COALESCE(posted_at, 0) DESC, created_at DESC',
             (run_id,),
@@ -422,7 +593,7 @@ def get_high_scoring_jobs(
     threshold: float = 8.0, limit: int = 10, db_path: Path = DEFAULT_DB_PATH
 ) -> list[dict]:
     """Get jobs with score >= threshold for proposal generation."""
-    with get_connection(db_path) as conn:
+    with get_reader_connection(db_path) as conn:
         rows = conn.execute(
             'SELECT * FROM jobs WHERE score >= ? ORDER BY score DESC LIMIT ?',
             (threshold, limit),
@@ -432,7 +603,11 @@ def get_high_scoring_jobs(
 
 def migrate_db(db_path: Path = DEFAULT_DB_PATH):
     """Run all database migrations to add missing columns."""
-    with get_connection(db_path) as conn:
+    with get_writer_connection(db_path) as conn:
+        # Hold the write lock from the column check through the ALTERs, so server workers
+        # migrating the same database at once can't both add the same column
+        conn.execute('BEGIN IMMEDIATE')
+
         # Check existing columns
         cursor = conn.execute('PRAGMA table_info(jobs)')
         columns = {row[1] for row in cursor.fetchall()}
@@ -494,8 +669,9 @@ def migrate_db(db_path: Path = DEFAULT_DB_PATH):
             if col_name not in columns:
                 conn.execute(f'ALTER TABLE jobs ADD COLUMN {col_name} {col_type}')
 
-        # Create index on posted_at if not exists
+        # Create indexes on posted_at and for the active job listing if not exists
         conn.execute('CREATE INDEX IF NOT EXISTS idx_posted_at ON jobs(posted_at)')
+        _create_active_job_indexes(conn)
 
 
 # Keep old name as alias for backwards compatibility
@@ -510,7 +686,7 @@ def dismiss_job(
 
     Returns True if job was dismissed, False if not found.
     """
-    with get_connection(db_path) as conn:
+    with get_writer_connection(db_path) as conn:
         cursor = conn.execute(
             'UPDATE jobs SET dismissed_at = CURRENT_TIMESTAMP, dismiss_reason = ? WHERE job_id = ?',
             (reason, job_id),
@@ -520,7 +696,7 @@ def dismiss_job(
 
 def restore_job(job_id: str, db_path: Path = DEFAULT_DB_PATH) -> bool:
     """Restore a dismissed job. Returns True if restored, False if not found."""
-    with get_connection(db_path) as conn:
+    with get_writer_connection(db_path) as conn:
         cursor = conn.execute(
             'UPDATE jobs SET dismissed_at = NULL, dismiss_reason = NULL WHERE job_id = ?',
             (job_id,),
@@ -528,6 +704,114 @@ def restore_job(job_id: str, db_path: Path = DEFAULT_DB_PATH) -> bool:
         return cursor.rowcount > 0
 
 
+# Columns for job listings: everything except raw_data (a full copy of the job the UI never reads),
+# and only the ai_analysis fields the UI shows, picked out by SQLite's json1 instead of in Python.
+# Invalid analysis JSON comes back as NULL.
+_ACTIVE_JOB_COLUMNS = """
+    job_id, run_id, search_query, title, description, url, type, hourly_min,
+    hourly_max, fixed_budget_amount, currency, duration, level, category,
+    category_name, category_urlSlug, categoryGroup_name, categoryGroup_urlSlug,
+    skills, qualifications, questions, location_restriction, connects_required,
+    contractorTier, numberOfPositionsToHire, applicants, premium, enterpriseJob,
+    isContractToHire, client_country, client_total_spent, client_hires,
+    client_rating, client_reviews, client_company_size, client_industry,
+    payment_verified, phone_verified, buyer_location_city,
+    buyer_location_countryTimezone, buyer_location_localTime,
+    buyer_location_offsetFromUtcMillis, buyer_avgHourlyJobsRate_amount,
+    buyer_company_contractDate, buyer_hire_rate_pct, buyer_jobs_openCount,
+    buyer_jobs_postedCount, buyer_stats_activeAssignmentsCount,
+    buyer_stats_hoursCount, buyer_stats_totalJobsWithHires,
+    clientActivity_invitationsSent, clientActivity_totalHired,
+    clientActivity_totalInvitedToInterview, clientActivity_unansweredInvites,
+    lastBuyerActivity, ts_create, posted_at, created_at, score, dismissed_at,
+    dismiss_reason,
+    CASE WHEN json_valid(ai_analysis) THEN json_object(
+        'meeting_risk', json_extract(ai_analysis, '$.meeting_risk'),
+        'scope_clarity', json_extract(ai_analysis, '$.scope_clarity'),
+        'agency_fit', json_extract(ai_analysis, '$.agency_fit'),
+        'red_flags', json_extract(ai_analysis, '$.red_flags'),
+        'meeting_indicators', json_extract(ai_analysis, '$.meeting_indicators')
+    ) END AS ai_analysis
+"""
+
+
+# Sort keys per get_active_jobs sort option, as (expression, direction) pairs.
+# rowid breaks ties in the opposite direction of the index scan, so a page is still
+# read straight off the idx_active_* indexes and every row has a unique position.
+_ACTIVE_SORT_KEYS = {
+    'newest': (('COALESCE(posted_at, 0)', 'DESC'), ('created_at', 'DESC'), ('rowid', 'ASC')),
+    'oldest': (('COALESCE(posted_at, 0)', 'ASC'), ('created_at', 'ASC'), ('rowid', 'DESC')),
+    'score_high': (
+        ('score', 'DESC NULLS LAST'),
+        ('COALESCE(posted_at, 0)', 'DESC'),
+        ('rowid', 'ASC'),
+    ),
+    'score_low': (
+        ('score', 'ASC NULLS LAST'),
+        ('COALESCE(posted_at, 0)', 'DESC'),
+        ('rowid', 'ASC'),
+    ),
+}
+
+
+def _encode_cursor(values: list) -> str:
+    """
+    Turn a row's sort key values into an opaque cursor.
+
+    orjson writes floats in their shortest round-trip form, so full-precision scores
+    come back bit-for-bit equal and the keyset comparisons neither skip nor repeat rows.
+    """
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode()
+
+
+def _decode_cursor(cursor: str, key_count: int) -> list:
+    """Decode a cursor back into sort key values. Raises ValueError if it is malformed."""
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, orjson.JSONDecodeError) as e:
+        raise ValueError(f'Invalid cursor: {cursor}') from e
+    if not isinstance(values, list) or len(values) != key_count:
+        raise ValueError(f'Invalid cursor: {cursor}')
+    return values
+
+
+def _after_cursor(sort_keys: tuple, values: list) -> tuple[str, list]:
+    """
+    Build a WHERE clause matching rows that sort after the given key values.
+
+    Expands to (k1 after v1) OR (k1 = v1 AND k2 after v2) OR ..., honouring each
+    key's direction and where SQLite places its NULLs.
+    """
+    clauses = []
+    params: list = []
+    equal_clauses: list[str] = []
+    equal_params: list = []
+    for (expr, direction), value in zip(sort_keys, values):
+        descending = direction.startswith('DESC')
+        nulls_last = direction.endswith('NULLS LAST') or (
+            descending and 'NULLS' not in direction
+        )
+        if value is None:
+            after = None if nulls_last else f'{expr} IS NOT NULL'
+            after_params = []
+        else:
+            after = f'{expr} {"<" if descending else ">"} ?'
+            if nulls_last:
+                after = f'({after} OR {expr} IS NULL)'
+            after_params = [value]
+        if after is not None:
+            clauses.append(' AND '.join([*equal_clauses, after]))
+            params.extend([*equal_params, *after_params])
+        if value is None:
+            equal_clauses.append(f'{expr} IS NULL')
+        else:
+            equal_clauses.append(f'{expr} = ?')
+            equal_params.append(value)
+    if not clauses:
+        return '0', []
+    return '(' + ' OR '.join(f'({clause})' for clause in clauses) + ')', params
+
+
 def get_active_jobs(
     limit: int = 50,
     offset: int = 0,
@@ -545,29 +829,80 @@ def get_active_jobs(
         min_score: Filter by minimum score (optional)
 
     Returns:
-        List of job dicts
+        List of job dicts, without raw_data and with a trimmed ai_analysis JSON string
     """
-    order_clauses = {
-        'newest': 'COALESCE(posted_at, 0) DESC, created_at DESC',
-        'oldest': 'COALESCE(posted_at, 0) ASC, created_at ASC',
-        'score_high': 'score DESC NULLS LAST, COALESCE(posted_at, 0) DESC',
-        'score_low': 'score ASC NULLS LAST, COALESCE(posted_at, 0) DESC',
-    }
-    order_by = order_clauses.get(sort, 'COALESCE(posted_at, 0) DESC, created_at DESC')
-
-    query = 'SELECT * FROM jobs WHERE dismissed_at IS NULL'
+    jobs, _ = get_active_jobs_page(
+        limit=limit, offset=offset, sort=sort, min_score=min_score, db_path=db_path
+    )
+    return jobs
+
+
+def get_active_jobs_page(
+    limit: int = 50,
+    offset: int = 0,
+    sort: str = 'newest',
+    min_score: float = None,
+    cursor: str = None,
+    db_path: Path = DEFAULT_DB_PATH,
+) -> tuple[list[dict], str | None]:
+    """
+    Get a page of non-dismissed jobs, with a cursor for the next page.
+
+    Passing the returned cursor back continues right after the last job of this page
+    (keyset pagination), so deep pages don't re-read every job before them the way
+    a large offset does, and stay stable when jobs are dismissed in between.
+
+    Args:
+        limit: Max jobs to return
+        offset: Pagination offset, applied after the cursor
+        sort: 'newest', 'oldest', 'score_high', 'score_low'
+        min_score: Filter by minimum score (optional)
+        cursor: Cursor returned with the previous page (optional)
+
+    Returns:
+        Tuple of (job dicts as in get_active_jobs, next page cursor or None on the last page)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    sort_keys = _ACTIVE_SORT_KEYS.get(sort, _ACTIVE_SORT_KEYS['newest'])
+    order_by = ', '.join(f'{expr} {direction}' for expr, direction in sort_keys)
+    # Plain columns rather than json_array(), which prints REALs with only 15 digits
+    sort_columns = [f'_sort_key_{i}' for i in range(len(sort_keys))]
+    sort_key = ', '.join(
+        f'{expr} AS {column}' for (expr, _), column in zip(sort_keys, sort_columns)
+    )
+
+    query = (
+        f'SELECT {_ACTIVE_JOB_COLUMNS}, {sort_key} '
+        'FROM jobs WHERE dismissed_at IS NULL'
+    )
     params: list = []
 
     if min_score is not None:
         query += ' AND score >= ?'
         params.append(min_score)
 
+    if cursor is not None:
+        after, after_params = _after_cursor(
+            sort_keys, _decode_cursor(cursor, len(sort_keys))
+        )
+        query += f' AND {after}'
+        params.extend(after_params)
+
     query += f' ORDER BY {order_by} LIMIT ? OFFSET ?'
     params.extend([limit, offset])
 
-    with get_connection(db_path) as conn:
+    with get_reader_connection(db_path) as conn:
         rows = conn.execute(query, params).fetchall()
-        return [dict(row) for row in rows]
+    jobs = []
+    sort_key_values = None
+    for row in rows:
+        job = dict(row)
+        sort_key_values = [job.pop(column) for column in sort_columns]
+        jobs.append(job)
+    next_cursor = _encode_cursor(sort_key_values) if len(jobs) == limit else None
+    return jobs, next_cursor
 
 
 def get_active_job_count(
@@ -581,14 +916,14 @@ def get_active_job_count(
         query += ' AND score >= ?'
         params.append(min_score)
 
-    with get_connection(db_path) as conn:
+    with get_reader_connection(db_path) as conn:
         result = conn.execute(query, params).fetchone()
         return result[0] if result else 0
 
 
 def get_scoring_stats(db_path: Path = DEFAULT_DB_PATH) -> dict:
     """Get statistics about job scoring."""
-    with get_connection(db_path) as conn:
+    with get_reader_connection(db_path) as conn:
         stats = {}
 
         # Total and scored counts
@@ -622,3 +957,39 @@ def get_scoring_stats(db_path: Path = DEFAULT_DB_PATH) -> dict:
         ).fetchone()[0]
 
         return stats
+
+
+def get_cached_llm_response(
+    key: str, max_age: float = None, db_path: Path = DEFAULT_DB_PATH
+) -> str | None:
+    """Get a cached AI response by key, ignoring entries older than max_age seconds."""
+    query = 'SELECT response FROM llm_cache WHERE hash = ?'
+    params: list = [key]
+    if max_age is not None:
+        query += ' AND created_at >= ?'
+        params.append(int(time.time() - max_age))
+    with get_reader_connection(db_path) as conn:
+        row = conn.execute(query, params).fetchone()
+        return row[0] if row else None
+
+
+def cache_llm_response(
+    key: str,
+    prompt_version: str,
+    model: str,
+    response: str,
+    db_path: Path = DEFAULT_DB_PATH,
+):
+    """Store an AI response in the cache, replacing any previous entry for the key."""
+    with get_writer_connection(db_path) as conn:
+        conn.execute(
+            '''INSERT OR REPLACE INTO llm_cache (hash, prompt_version, model, response, created_at)
+               VALUES (?, ?, ?, ?, ?)''',
+            (key, prompt_version, model, response, int(time.time())),
+        )
+
+
+def delete_cached_llm_response(key: str, db_path: Path = DEFAULT_DB_PATH):
+    """Remove a cached AI response, e.g. one that turned out not to parse."""
+    with get_writer_connection(db_path) as conn:
+        conn.execute('DELETE FROM llm_cache WHERE hash = ?', (key,))
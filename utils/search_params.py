@@ -0,0 +1,292 @@
+"""
+Upwork search parameter normalization and search URL building.
+
+Pure, I/O-free helpers (apart from reading the bundled category data once). The scraper
+itself is bound by network latency (browser, HTTP) rather than CPU, so the speedups there
+come from concurrency and C-backed parsing, not from compiling Python. If CPU work ever
+does show up in profiles, this module is the place for it: it only does dict and string
+handling on plain str/list inputs, which suits mypyc or Cython, whereas Numba can't
+compile dict/str code at all.
+"""
+
+import functools
+import json
+import logging
+from pathlib import Path
+from urllib.parse import urlencode
+
+# shared with the scraper, configured by utils.logger.Logger
+logger = logging.getLogger('Upwork')
+
+# Upwork category name -> UID data, see _category_uids()
+CATEGORIES_PATH = Path(__file__).parent / 'categories.json'
+
+# Fixed price category number -> Upwork amount range
+_AMOUNT_RANGES = {
+    '1': '0-99',
+    '2': '100-499',
+    '3': '500-999',
+    '4': '1000-4999',
+    '5': '5000-',
+}
+# Config workload -> Upwork workload filter
+_WORKLOAD_MAP = {'part_time': 'as_needed', 'full_time': 'full_time'}
+# Config sort -> Upwork sort order, unknown values are passed through
+_SORT_MAP = {
+    'relevance': 'relevance+desc',
+    'newest': 'recency',
+    'client_total_charge': 'client_total_charge+desc',
+    'client_rating': 'client_rating+desc',
+}
+
+
+@functools.cache
+def _category_uids() -> dict[str, tuple[str, bool]]:
+    """
+    Load the Upwork categories once and map each lowercase category name to (UID, is main category).
+    Main categories win on name clashes.
+
+    :return: Dictionary of category name -> (UID, is main category)
+    :rtype: dict[str, tuple[str, bool]]
+    """
+    with open(CATEGORIES_PATH, 'rb') as f:
+        raw = json.load(f)
+    uids = {
+        name.lower(): (uid, False)
+        for subcategories in raw['subcategories'].values()
+        for name, uid in subcategories.items()
+    }
+    uids.update((name.lower(), (uid, True)) for name, uid in raw['main'].items())
+    return uids
+
+
+def _freeze_params(params: dict) -> tuple:
+    """
+    Turn a search params dict into a hashable, order-independent cache key (lists become tuples).
+    """
+    return tuple(
+        sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in params.items())
+    )
+
+
+def _thaw_params(frozen_params: tuple) -> dict:
+    """
+    Inverse of _freeze_params, turns tuples back into lists.
+    """
+    return {k: list(v) if isinstance(v, tuple) else v for k, v in frozen_params}
+
+
+def _cached_call(cached_func, params: dict, *args):
+    """
+    Call an lru_cache'd function with frozen params, bypassing the cache if a value is unhashable.
+    """
+    frozen_params = _freeze_params(params)
+    try:
+        hash(frozen_params)
+    except TypeError:
+        return cached_func.__wrapped__(frozen_params, *args)
+    return cached_func(frozen_params, *args)
+
+
+def normalize_search_params(
+    params: dict, credentials_provided: bool, buffer: int = 5
+) -> tuple[dict, int]:
+    """
+    Normalize search parameters from config or input JSON for Upwork job search URL.
+    Results are cached per distinct set of params.
+
+    :param params: Dictionary of search parameters (from config or user input)
+    :type params: dict
+    :param credentials_provided: Whether Upwork credentials are provided (affects access to some filters)
+    :type credentials_provided: bool
+    :return: Tuple of (normalized_params dict, limit int)
+    """
+    result, limit = _cached_call(
+        _normalize_search_params_cached, params, credentials_provided, buffer
+    )
+    # hand out a copy so callers can't alter the cached dict
+    return dict(result), limit
+
+
+@functools.lru_cache(maxsize=128)
+def _normalize_search_params_cached(
+    frozen_params: tuple, credentials_provided: bool, buffer: int
+) -> tuple[dict, int]:
+    params = _thaw_params(frozen_params)
+    result = {}
+
+    # Get and validate the limit (no buffer here)
+    try:
+        limit = int(params.get('limit', 5)) + buffer
+    except (ValueError, TypeError):
+        limit = 5
+        logger.warning('Invalid limit value in config, using default limit of 5')
+
+    # Set per_page parameter to the next allowed Upwork value >= limit
+    allowed_per_page = [10, 20, 50]
+    per_page = min([v for v in allowed_per_page if v >= limit] or [50])
+    result['per_page'] = str(per_page)
+
+    # Fixed price categories and custom range
+    if 'fixed_price_catagory_num' in params:
+        ranges = []
+        for cat in params['fixed_price_catagory_num']:
+            if cat in _AMOUNT_RANGES:
+                ranges.append(_AMOUNT_RANGES[cat])
+        if params.get('fixed_min') and params.get('fixed_max'):
+            ranges.append(f'{params["fixed_min"]}-{params["fixed_max"]}')
+        if ranges:
+            result['amount'] = ','.join(ranges)
+
+    # Client hires (convert min/max to ranges)
+    if 'hires_min' in params or 'hires_max' in params:
+        ranges = []
+        min_val = int(params.get('hires_min', 0))
+        max_val = int(params.get('hires_max', float('inf')))
+        if min_val <= 9 and max_val >= 1:
+            ranges.append('1-9')
+        if max_val >= 10:
+            ranges.append('10-')
+        if ranges:
+            result['client_hires'] = ','.join(ranges)
+
+    # Expertise level (contractor tier)
+    if 'expertise_level_number' in params:
+        result['contractor_tier'] = ','.join(params['expertise_level_number'])
+
+    # Duration
+    if 'projectDuration' in params:
+        result['duration_v3'] = ','.join(params['projectDuration'])
+
+    # Hourly rate range
+    if 'hourly_min' in params and 'hourly_max' in params:
+        result['hourly_rate'] = f'{params["hourly_min"]}-{params["hourly_max"]}'
+
+    # Job type (hourly/fixed)
+    job_types = []
+    if params.get('hourly'):
+        job_types.append('0')
+    if params.get('fixed'):
+        job_types.append('1')
+    if job_types:
+        result['t'] = ','.join(job_types)
+
+    # Workload mapping
+    if 'workload' in params:
+        result['workload'] = ','.join(
+            _WORKLOAD_MAP[w] for w in params['workload'] if w in _WORKLOAD_MAP
+        )
+
+    # Sort order
+    if 'sort' in params:
+        result['sort'] = _SORT_MAP.get(params['sort'], params['sort'])
+
+    # Query building
+    q_parts = []
+
+    # Main query
+    if params.get('query'):
+        q_parts.append(params['query'])
+
+    # Any words (OR)
+    if params.get('search_any'):
+        words = params['search_any'].split()
+        q_parts.append(f'({" OR ".join(words)})')
+
+    if q_parts:
+        result['q'] = ' AND '.join(q_parts)
+
+    # Pass through boolean/string params that map directly
+    for key in ['contract_to_hire', 'previous_clients']:
+        if key in params:
+            result[key] = str(params[key]).lower()
+
+    # login required fields
+    if not credentials_provided:
+        result['proposals'] = ''
+        result['payment_verified'] = ''
+        result['previous_clients'] = ''
+    else:
+        # Proposal number (proposals filter) from a direct string input
+        if 'proposal_num' in params and params['proposal_num']:
+            result['proposals'] = ','.join(params['proposal_num'])
+        # payment verified
+        if 'payment_verified' in params and params['payment_verified']:
+            result['payment_verified'] = '1'
+
+    # Categories (main category UID and subcategory UID)
+    if 'category' in params and params['category']:
+        main_cat_uids = []
+        sub_cat_uids = []
+        for cat_name in params['category']:
+            entry = _category_uids().get(cat_name.lower())
+            if entry is None:
+                logger.warning(
+                    f"Category '{cat_name}' not found in any category map, skipping."
+                )
+                continue
+            uid, is_main = entry
+            (main_cat_uids if is_main else sub_cat_uids).append(uid)
+
+        if main_cat_uids:
+            result['category2_uid'] = ','.join(main_cat_uids)
+        if sub_cat_uids:
+            result['subcategory2_uid'] = ','.join(sub_cat_uids)
+
+    return result, limit
+
+
+# Params consumed by build_upwork_search_url itself rather than passed through as filters
+_URL_NON_FILTER_KEYS = frozenset(
+    {
+        'base_url',
+        'all_words',
+        'any_words',
+        'none_words',
+        'exact_phrase',
+        'title_search',
+        'q',
+    }
+)
+
+
+def build_upwork_search_url(params: dict) -> str:
+    """
+    Build an Upwork job search URL from the given parameters dict.
+    Results are cached per distinct set of params.
+
+    :param params: Dictionary of normalized search parameters
+    :type params: dict
+    :return: Upwork job search URL as a string
+    :rtype: str
+    """
+    return _cached_call(_build_upwork_search_url_cached, params)
+
+
+@functools.lru_cache(maxsize=128)
+def _build_upwork_search_url_cached(frozen_params: tuple) -> str:
+    params = _thaw_params(frozen_params)
+    base_url = params.get('base_url', 'https://www.upwork.com/nx/search/jobs/')
+    # Advanced search logic for 'q'
+    q_parts = []
+    if params.get('all_words'):
+        q_parts.append(params['all_words'])
+    if params.get('any_words'):
+        q_parts.append('(' + ' OR '.join(params['any_words'].split()) + ')')
+    if params.get('none_words'):
+        q_parts.append(' '.join(f'-{w}' for w in params['none_words'].split()))
+    if params.get('exact_phrase'):
+        q_parts.append(f'"{params["exact_phrase"]}"')
+    if params.get('title_search'):
+        q_parts.append(' '.join(f'title:{w}' for w in params['title_search'].split()))
+    q = ' '.join(q_parts) if q_parts else params.get('q', '')
+    # If only 'q' is present, return minimal URL
+    minimal_keys = {'q', 'base_url'}
+    if set(params.keys()).issubset(minimal_keys) or (q and len(params) == 1):
+        return f'{base_url}?' + urlencode({'q': q})
+    # Otherwise, add all filters and any extra params present in config/inputJson
+    url_params = {'q': q}
+    url_params.update(
+        (k, v) for k, v in params.items() if k not in _URL_NON_FILTER_KEYS
+    )
+    return f'{base_url}?' + urlencode(url_params)